@@ -65,6 +65,9 @@ class DisplayConfig(BaseModel):
     hackernews_stories_per_page: int = Field(
         default=5, description="Number of stories per page", ge=1, le=50
     )
+    hackernews_max_pages: int = Field(
+        default=10, description="Maximum number of pages to fetch and rotate through", ge=1
+    )
     # Time slots for TODO display (format: "0-12,18-24" means show during these hours)
     # HackerNews will automatically show during non-TODO hours
     todo_time_slots: str = Field(
@@ -87,6 +90,7 @@ class DisplayConfig(BaseModel):
             hackernews_refresh_minutes=int(os.getenv("HACKERNEWS_REFRESH_MINUTES", "60")),
             hackernews_page_seconds=int(os.getenv("HACKERNEWS_PAGE_SECONDS", "30")),
             hackernews_stories_per_page=int(os.getenv("HACKERNEWS_STORIES_PER_PAGE", "5")),
+            hackernews_max_pages=int(os.getenv("HACKERNEWS_MAX_PAGES", "10")),
             todo_time_slots=os.getenv("TODO_TIME_SLOTS", "0-12,18-24"),
         )
 
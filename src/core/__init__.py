@@ -2,8 +2,10 @@
 
 from .cache import TTLCache, cached
 from .display_controller import DisplayController
+from .display_lock import display_lock
 from .display_mode import DisplayMode, DisplayModeRegistry, get_registry, register_mode
 from .events import Event, EventBus, EventType, get_event_bus, on_event
+from .http import close_http_client, get_http_client
 from .performance import PerformanceMonitor, log_slow_operations, measure_time
 from .retry import api_retry, critical_api_retry, fast_retry, with_retry
 from .state import StateManager
@@ -17,6 +19,8 @@ __all__ = [
     "cached",
     # Display controller
     "DisplayController",
+    # Display lock
+    "display_lock",
     # Display modes
     "DisplayMode",
     "DisplayModeRegistry",
@@ -28,6 +32,9 @@ __all__ = [
     "EventType",
     "get_event_bus",
     "on_event",
+    # HTTP
+    "get_http_client",
+    "close_http_client",
     # Performance
     "PerformanceMonitor",
     "measure_time",
@@ -4,18 +4,28 @@ This module provides decorators and utilities for caching function results
 with time-to-live (TTL) expiration and LRU eviction policies.
 """
 
-import asyncio
 import functools
 import logging
+import threading
 import time
 from collections import OrderedDict
 from typing import Any, Callable, TypeVar
 
 logger = logging.getLogger(__name__)
 
+# Monotonic clock for TTL bookkeeping: immune to NTP/wall-clock jumps,
+# pre-bound to skip the module attribute lookup on every cache access
+_monotonic = time.monotonic
+
 # Type variable for generic function
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Separates positional from keyword arguments in cache keys
+_KWD_MARK = object()
+
+# Sentinel distinguishing "not cached" from a legitimately cached None
+_MISS = object()
+
 
 class TTLCache:
     """Time-to-live cache with LRU eviction.
@@ -23,8 +33,8 @@ class TTLCache:
     Features:
     - TTL-based expiration
     - LRU eviction when max size reached
-    - Thread-safe operations
-    - Async-compatible
+    - Lock-free reads (asyncio code between awaits is already serialized)
+    - Thread-safe mutations
 
     Example:
         >>> cache = TTLCache(maxsize=100, ttl=300)
@@ -41,81 +51,89 @@ class TTLCache:
         """
         self.maxsize = maxsize
         self.ttl = ttl
-        self._cache: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
-        self._lock = asyncio.Lock()
-
-    async def get(self, key: Any) -> Any | None:
+        # Structure-of-arrays: values and expiry deadlines in lock-step
+        # dicts instead of per-entry (value, timestamp) tuples
+        self._values: OrderedDict[Any, Any] = OrderedDict()
+        self._expires: dict[Any, float] = {}
+        # Mutations only; reads are safe without a lock on the asyncio loop
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any | None:
         """Get value from cache.
 
+        Lock-free: on a single asyncio loop every operation here runs
+        between suspension points and is therefore atomic.
+
         Args:
             key: Cache key
+            default: Value to return on a miss (pass a sentinel to
+                distinguish a miss from a cached None)
 
         Returns:
-            Cached value or None if not found/expired
+            Cached value, or ``default`` if not found/expired
         """
-        async with self._lock:
-            if key not in self._cache:
-                return None
-
-            value, timestamp = self._cache[key]
-
-            # Check if expired
-            if time.time() - timestamp > self.ttl:
-                logger.debug(f"Cache expired: {key}")
-                del self._cache[key]
-                return None
-
-            # Move to end (LRU)
-            self._cache.move_to_end(key)
-            logger.debug(f"Cache hit: {key}")
-            return value
-
-    async def set(self, key: Any, value: Any) -> None:
+        deadline = self._expires.get(key)
+        if deadline is None:
+            return default
+
+        # Deadline precomputed at set time: a single compare, no arithmetic
+        if _monotonic() > deadline:
+            logger.debug(f"Cache expired: {key}")
+            del self._values[key]
+            del self._expires[key]
+            return default
+
+        # Move to end (LRU)
+        values = self._values
+        values.move_to_end(key)
+        logger.debug(f"Cache hit: {key}")
+        return values[key]
+
+    def set(self, key: Any, value: Any) -> None:
         """Set value in cache.
 
         Args:
             key: Cache key
             value: Value to cache
         """
-        async with self._lock:
-            # Remove oldest if at capacity
-            if len(self._cache) >= self.maxsize and key not in self._cache:
-                oldest_key = next(iter(self._cache))
-                logger.debug(f"Cache eviction (LRU): {oldest_key}")
-                del self._cache[oldest_key]
-
-            # Add/update with current timestamp
-            self._cache[key] = (value, time.time())
-            self._cache.move_to_end(key)
+        with self._lock:
+            values = self._values
+            if key in values:
+                # Update in place, then refresh LRU position
+                values[key] = value
+                values.move_to_end(key)
+            else:
+                # Evict oldest if at capacity; new insertions land at the end
+                if len(values) >= self.maxsize:
+                    oldest_key, _ = values.popitem(last=False)
+                    del self._expires[oldest_key]
+                    logger.debug(f"Cache eviction (LRU): {oldest_key}")
+                values[key] = value
+            self._expires[key] = _monotonic() + self.ttl
             logger.debug(f"Cache set: {key}")
 
-    async def delete(self, key: Any) -> None:
+    def delete(self, key: Any) -> None:
         """Delete value from cache.
 
         Args:
             key: Cache key
         """
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        with self._lock:
+            if key in self._values:
+                del self._values[key]
+                del self._expires[key]
                 logger.debug(f"Cache deleted: {key}")
 
-    async def clear(self) -> None:
+    def clear(self) -> None:
         """Clear all cached values."""
-        async with self._lock:
-            self._cache.clear()
+        with self._lock:
+            self._values.clear()
+            self._expires.clear()
             logger.debug("Cache cleared")
 
     def get_sync(self, key: Any) -> Any | None:
-        """Synchronous get (no lock, use with caution)."""
-        if key not in self._cache:
-            return None
-
-        value, timestamp = self._cache[key]
-        if time.time() - timestamp > self.ttl:
-            return None
-
-        return value
+        """Backward-compatible alias for :meth:`get`, which is now synchronous."""
+        return self.get(key)
 
 
 def cached(ttl: int = 300, maxsize: int = 128):
@@ -130,22 +148,33 @@ def cached(ttl: int = 300, maxsize: int = 128):
         >>> async def fetch_data(param):
         >>>     return await expensive_operation(param)
     """
+    # Disabled cache (useful for tests/debugging): decorate with identity
+    # so calls pay no key-build/lookup/wrapper cost at all
+    if maxsize <= 0 or ttl <= 0:
+
+        def identity(func: F) -> F:
+            return func
+
+        return identity
+
     cache = TTLCache(maxsize=maxsize, ttl=ttl)
 
     def decorator(func: F) -> F:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create cache key from args and kwargs
-            key = (args, tuple(sorted(kwargs.items())))
-
-            # Check cache
-            cached_value = await cache.get(key)
-            if cached_value is not None:
+            # Zero-kwarg calls (the common case) use args directly as the
+            # key; otherwise rely on dict insertion order instead of sorting
+            key = args if not kwargs else (*args, _KWD_MARK, *kwargs.items())
+
+            # Check cache (synchronous, no event-loop round trip); the
+            # sentinel lets a cached None count as a hit
+            cached_value = cache.get(key, _MISS)
+            if cached_value is not _MISS:
                 return cached_value
 
             # Call function and cache result
             result = await func(*args, **kwargs)
-            await cache.set(key, result)
+            cache.set(key, result)
             return result
 
         # Attach cache for manual control
@@ -165,4 +194,4 @@ def cache_key(*args, **kwargs) -> tuple:
     Returns:
         Hashable cache key tuple
     """
-    return (args, tuple(sorted(kwargs.items())))
+    return args if not kwargs else (*args, _KWD_MARK, *kwargs.items())
@@ -6,7 +6,10 @@ This module handles data fetching logic for different display modes.
 import logging
 from typing import Any
 
+from src.layouts.holiday import HolidayManager
 from src.providers import Dashboard
+from src.providers.poetry import get_poetry
+from src.providers.quote import get_quote
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,17 @@ class DataFetcher:
             dashboard: Dashboard provider instance
         """
         self.dashboard = dashboard
+        self._holiday_manager = HolidayManager()
+
+        # Mode dispatch table: O(1) lookup instead of a string-compare chain
+        self._dispatch = {
+            "dashboard": self._fetch_dashboard,
+            "quote": self._fetch_quote,
+            "poetry": self._fetch_poetry,
+            "wallpaper": self._fetch_wallpaper,
+            "holiday": self._fetch_holiday,
+            "year_end": self._fetch_year_end,
+        }
 
     async def fetch(self, mode: str) -> dict[str, Any]:
         """Fetch data for a display mode.
@@ -43,21 +57,12 @@ class DataFetcher:
         """
         logger.debug(f"Fetching data for mode: {mode}")
 
-        if mode == "dashboard":
-            return await self._fetch_dashboard()
-        elif mode == "quote":
-            return await self._fetch_quote()
-        elif mode == "poetry":
-            return await self._fetch_poetry()
-        elif mode == "wallpaper":
-            return await self._fetch_wallpaper()
-        elif mode == "holiday":
-            return await self._fetch_holiday()
-        elif mode == "year_end":
-            return await self._fetch_year_end()
-        else:
+        fetch_fn = self._dispatch.get(mode)
+        if fetch_fn is None:
             logger.warning(f"Unknown mode '{mode}', using dashboard")
-            return await self._fetch_dashboard()
+            fetch_fn = self._fetch_dashboard
+
+        return await fetch_fn()
 
     async def _fetch_dashboard(self) -> dict[str, Any]:
         """Fetch dashboard data."""
@@ -65,15 +70,11 @@ class DataFetcher:
 
     async def _fetch_quote(self) -> dict[str, Any]:
         """Fetch quote data."""
-        from src.providers.quote import get_quote
-
         quote = await get_quote(self.dashboard.client)
         return {"quote": quote}
 
     async def _fetch_poetry(self) -> dict[str, Any]:
         """Fetch poetry data."""
-        from src.providers.poetry import get_poetry
-
         poetry = await get_poetry(self.dashboard.client)
         return {"poetry": poetry}
 
@@ -83,10 +84,7 @@ class DataFetcher:
 
     async def _fetch_holiday(self) -> dict[str, Any]:
         """Fetch holiday data."""
-        from src.layouts.holiday import HolidayManager
-
-        holiday_manager = HolidayManager()
-        holiday = holiday_manager.get_holiday()
+        holiday = self._holiday_manager.get_holiday()
         return {"holiday": holiday}
 
     async def _fetch_year_end(self) -> dict[str, Any]:
@@ -8,7 +8,7 @@ import logging
 
 import pendulum
 
-from src.config import Config
+from src.config import Config, register_reload_callback
 from src.layouts.holiday import HolidayManager
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,31 @@ class DisplayController:
             config: Configuration object (defaults to global Config)
         """
         self.config = config or Config
+        self._holiday_manager = HolidayManager()
+
+        # Holiday status only changes at midnight, so memoize it per day
+        # instead of probing the holiday tables on every refresh tick
+        self._holiday_cache_date: tuple[int, int, int] | None = None
+        self._holiday_cache_value: dict[str, str] | None = None
+
+        # Precomputed instead of rebuilt on every tick; the .env watcher
+        # replaces Config.display wholesale on reload, so re-snapshot via
+        # the reload callback to keep interval changes hot-applicable
+        self._rebuild_intervals()
+        register_reload_callback(self._rebuild_intervals)
+
+    def _rebuild_intervals(self) -> None:
+        """Snapshot the per-mode refresh intervals from the live config."""
+        display = self.config.display
+        self._interval_map = {
+            "dashboard": display.refresh_interval_dashboard,
+            "quote": display.refresh_interval_quote,
+            "poetry": display.refresh_interval_poetry,
+            "wallpaper": display.refresh_interval_wallpaper,
+            "holiday": display.refresh_interval_holiday,
+            "year_end": display.refresh_interval_year_end,
+        }
+        self._default_interval = self.config.hardware.refresh_interval
 
     def get_current_mode(self, now: pendulum.DateTime | None = None) -> str:
         """Determine current display mode based on time and configuration.
@@ -53,9 +78,13 @@ class DisplayController:
         if now is None:
             now = pendulum.now(self.config.hardware.timezone)
 
-        # Check for holiday
-        holiday_manager = HolidayManager()
-        if holiday_manager.get_holiday():
+        # Check for holiday (memoized per day)
+        today = (now.year, now.month, now.day)
+        if self._holiday_cache_date != today:
+            self._holiday_cache_value = self._holiday_manager.get_holiday()
+            self._holiday_cache_date = today
+
+        if self._holiday_cache_value:
             logger.info("🎉 Holiday detected, using holiday mode")
             return "holiday"
 
@@ -76,15 +105,6 @@ class DisplayController:
         Returns:
             Refresh interval in seconds
         """
-        interval_map = {
-            "dashboard": self.config.display.refresh_interval_dashboard,
-            "quote": self.config.display.refresh_interval_quote,
-            "poetry": self.config.display.refresh_interval_poetry,
-            "wallpaper": self.config.display.refresh_interval_wallpaper,
-            "holiday": self.config.display.refresh_interval_holiday,
-            "year_end": self.config.display.refresh_interval_year_end,
-        }
-
-        interval = interval_map.get(mode, self.config.hardware.refresh_interval)
+        interval = self._interval_map.get(mode, self._default_interval)
         logger.debug(f"Refresh interval for mode '{mode}': {interval}s")
         return interval
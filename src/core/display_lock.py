@@ -0,0 +1,14 @@
+"""Process-wide lock serializing access to the E-Paper display.
+
+The EPD hangs off a single SPI bus, so a full refresh from the main loop
+must never overlap a partial refresh from a background task (or vice
+versa): concurrent transfers corrupt the frame, and ``epd.sleep()`` can
+power the panel down mid-transfer. Every code path that touches the
+panel — init, display, partial refresh, sleep — must hold this lock for
+the whole sequence, keeping it held across any ``asyncio.to_thread``
+await that wraps the blocking SPI call.
+"""
+
+import asyncio
+
+display_lock = asyncio.Lock()
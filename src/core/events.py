@@ -6,7 +6,6 @@ components using the observer pattern.
 
 import asyncio
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Coroutine
@@ -41,9 +40,9 @@ class EventType(Enum):
     FULL_REFRESH = "full_refresh"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
-    """Event data container.
+    """Event data container (immutable; shared safely across handlers).
 
     Attributes:
         type: Event type
@@ -67,8 +66,10 @@ class EventBus:
     """
 
     def __init__(self):
-        self._handlers: dict[EventType, list[EventHandler]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Plain dict: a defaultdict would grow an empty list for every
+        # event type ever looked up, subscribed or not. No lock needed:
+        # all mutations run synchronously on the event loop.
+        self._handlers: dict[EventType, list[EventHandler]] = {}
 
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
         """Subscribe to an event type.
@@ -77,7 +78,7 @@ class EventBus:
             event_type: Type of event to listen for
             handler: Async function to call when event occurs
         """
-        self._handlers[event_type].append(handler)
+        self._handlers.setdefault(event_type, []).append(handler)
         logger.debug(f"Subscribed to {event_type.value}: {handler.__name__}")
 
     def unsubscribe(self, event_type: EventType, handler: EventHandler) -> None:
@@ -87,8 +88,9 @@ class EventBus:
             event_type: Type of event
             handler: Handler to remove
         """
-        if handler in self._handlers[event_type]:
-            self._handlers[event_type].remove(handler)
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
             logger.debug(f"Unsubscribed from {event_type.value}: {handler.__name__}")
 
     async def publish(self, event: Event) -> None:
@@ -97,23 +99,36 @@ class EventBus:
         Args:
             event: Event to publish
         """
-        handlers = self._handlers.get(event.type, [])
+        handlers = self._handlers.get(event.type)
 
         if not handlers:
             logger.debug(f"No handlers for event: {event.type.value}")
             return
 
+        # Snapshot so concurrent subscribe/unsubscribe can't mutate the
+        # list while handlers are awaited
+        handlers = tuple(handlers)
+
         logger.debug(f"Publishing event: {event.type.value} (source: {event.source})")
 
-        # Call all handlers concurrently
-        tasks = [handler(event) for handler in handlers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Single subscriber (the common case): await directly, skipping
+        # gather's Task and _GatheringFuture allocations
+        if len(handlers) == 1:
+            await self._call_handler(handlers[0], event)
+            return
 
-        # Log any exceptions
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                handler_name = handlers[i].__name__
-                logger.error(f"Error in event handler {handler_name}: {result}")
+        # Call all handlers concurrently; each call is guarded so one
+        # failing handler cannot affect the others, which also avoids
+        # gather's results list and exception wrapping
+        await asyncio.gather(*(self._call_handler(handler, event) for handler in handlers))
+
+    @staticmethod
+    async def _call_handler(handler: EventHandler, event: Event) -> None:
+        """Invoke a single handler, logging (not propagating) its errors."""
+        try:
+            await handler(event)
+        except Exception as e:
+            logger.error(f"Error in event handler {handler.__name__}: {e}")
 
     async def emit(
         self, event_type: EventType, data: dict[str, Any] | None = None, source: str | None = None
@@ -0,0 +1,43 @@
+"""Shared HTTP client for display modes and providers.
+
+Modes that previously opened a fresh ``httpx.AsyncClient`` per refresh
+paid a TCP + TLS handshake on every fetch. This module owns a single
+long-lived client with keep-alive connections so repeat requests to the
+same hosts reuse their sockets.
+"""
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        Process-wide AsyncClient with keep-alive connection pooling
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            # One transport-level retry covers transient connect failures
+            # without duplicating the providers' tenacity policies
+            transport=httpx.AsyncHTTPTransport(retries=1),
+            headers={"User-Agent": "eink-dashboard"},
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (call once on application shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.debug("Shared HTTP client closed")
+    _client = None
@@ -20,11 +20,18 @@ def measure_time(func: F) -> F:
 
     Works with both sync and async functions.
 
+    Note: the check happens at decoration time, so timing is only
+    emitted when the logger is set to INFO (or lower) at startup.
+
     Usage:
         @measure_time
         async def slow_function():
             await asyncio.sleep(1)
     """
+    # No-op fast path: when INFO timing is off there is no point paying
+    # for a wrapper call frame on every invocation
+    if not logger.isEnabledFor(logging.INFO):
+        return func
 
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
@@ -33,8 +40,11 @@ def measure_time(func: F) -> F:
             result = await func(*args, **kwargs)
             return result
         finally:
-            elapsed = time.perf_counter() - start_time
-            logger.info(f"⏱️  {func.__name__} took {elapsed:.3f}s")
+            # %-style args defer formatting until the record is emitted,
+            # so this is nearly free when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                elapsed = time.perf_counter() - start_time
+                logger.info("⏱️  %s took %.3fs", func.__name__, elapsed)
 
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
@@ -43,8 +53,9 @@ def measure_time(func: F) -> F:
             result = func(*args, **kwargs)
             return result
         finally:
-            elapsed = time.perf_counter() - start_time
-            logger.info(f"⏱️  {func.__name__} took {elapsed:.3f}s")
+            if logger.isEnabledFor(logging.INFO):
+                elapsed = time.perf_counter() - start_time
+                logger.info("⏱️  %s took %.3fs", func.__name__, elapsed)
 
     if inspect.iscoroutinefunction(func):
         return async_wrapper  # type: ignore
@@ -108,6 +119,8 @@ class PerformanceMonitor:
             result = await async_operation()
     """
 
+    __slots__ = ("operation_name", "log_level", "start_time")
+
     def __init__(self, operation_name: str, log_level: int = logging.INFO):
         self.operation_name = operation_name
         self.log_level = log_level
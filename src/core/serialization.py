@@ -0,0 +1,36 @@
+"""JSON serialization helpers for the E-Ink dashboard application.
+
+Uses orjson (a SIMD-accelerated C implementation) when it is installed
+and falls back to the stdlib transparently, so callers never need to
+know which backend is active. All helpers work in bytes to skip the
+UTF-8 encode/decode round trip that text-mode I/O performs.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+
+    def json_dumps(value: Any) -> bytes:
+        """Serialize a value to pretty-printed UTF-8 JSON bytes."""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def json_dumps(value: Any) -> bytes:
+        """Serialize a value to pretty-printed UTF-8 JSON bytes."""
+        return json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
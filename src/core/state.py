@@ -5,15 +5,23 @@ caching and persistent file storage with async I/O operations.
 """
 
 import asyncio
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 from ..exceptions import StateError
+from .serialization import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Payloads below this run their file I/O inline: for tiny JSON blobs the
+# executor thread-hop costs more than the syscall it offloads
+_SYNC_IO_THRESHOLD = 8192
+
+# Filename sanitation table: one C-level scan instead of chained replace()
+_SANITIZE = str.maketrans({"/": "_", "\\": "_"})
+
 
 class StateManager:
     """Manages application state with in-memory cache and file persistence.
@@ -30,29 +38,63 @@ class StateManager:
         >>> page = await state.get("hackernews_page", default=1)
     """
 
-    def __init__(self, state_dir: Path):
+    def __init__(self, state_dir: Path, flush_interval: float = 0):
         """Initialize state manager.
 
         Args:
             state_dir: Directory to store state files
+            flush_interval: Seconds to coalesce writes before persisting.
+                0 (the default) writes through on every set; a positive
+                value batches dirty keys and flushes them after the
+                interval, trading up to that much durability for far
+                fewer disk writes on frequently updated keys.
         """
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
         self._cache: dict[str, Any] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        self._dirty: set[str] = set()
+        self._flush_task: asyncio.Task | None = None
+        # Fixed stripe of locks indexed by key hash: O(1) lookup with no
+        # unbounded dict growth (each Lock holds a waiter deque)
+        self._stripes = tuple(asyncio.Lock() for _ in range(16))
         self._global_lock = asyncio.Lock()
+        # Event loop resolved lazily on first async call; executor stays
+        # None (the default pool) but can be swapped for a dedicated one
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._executor = None
+        # Memoized key -> Path: Path construction allocates a parts tuple
+        self._paths: dict[str, Path] = {}
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running loop, resolving and caching it on first use."""
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
 
     def _get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a lock for a specific key."""
-        if key not in self._locks:
-            self._locks[key] = asyncio.Lock()
-        return self._locks[key]
+        """Get the lock stripe for a key.
+
+        Unrelated keys may share a stripe; with the dashboard's small
+        key set the collision serialization is negligible.
+        """
+        return self._stripes[hash(key) & 15]
 
     def _get_file_path(self, key: str) -> Path:
-        """Get file path for a state key."""
-        # Sanitize key for filename
-        safe_key = key.replace("/", "_").replace("\\", "_")
-        return self.state_dir / f"{safe_key}.json"
+        """Get file path for a state key (sanitized, memoized per key)."""
+        path = self._paths.get(key)
+        if path is None:
+            path = self._paths[key] = self.state_dir / f"{key.translate(_SANITIZE)}.json"
+        return path
+
+    @staticmethod
+    def _write_atomic(file_path: Path, content: bytes) -> None:
+        """Write to a temp file then rename, so a crash mid-write can
+        never leave a truncated state file behind."""
+        tmp_path = file_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
 
     async def get(self, key: str, default: Any = None) -> Any:
         """Get state value by key.
@@ -79,10 +121,14 @@ class StateManager:
                 return default
 
             try:
-                # Read file asynchronously
-                loop = asyncio.get_event_loop()
-                content = await loop.run_in_executor(None, file_path.read_text, "utf-8")
-                value = json.loads(content)
+                # Small files are read inline; only large payloads are
+                # worth a thread hop (bytes: the parser decodes itself)
+                if file_path.stat().st_size < _SYNC_IO_THRESHOLD:
+                    content = file_path.read_bytes()
+                else:
+                    loop = self._get_loop()
+                    content = await loop.run_in_executor(self._executor, file_path.read_bytes)
+                value = json_loads(content)
 
                 # Update cache
                 self._cache[key] = value
@@ -109,19 +155,58 @@ class StateManager:
             # Update cache
             self._cache[key] = value
 
-            # Persist to file
-            file_path = self._get_file_path(key)
-            try:
-                # Write file asynchronously
-                loop = asyncio.get_event_loop()
-                content = json.dumps(value, indent=2, ensure_ascii=False)
-                await loop.run_in_executor(None, file_path.write_text, content, "utf-8")
-                logger.debug(f"State persisted: {key}")
+            # Coalescing mode: mark dirty and let the deferred flush
+            # write it out, instead of hitting disk on every set
+            if self.flush_interval > 0:
+                self._dirty.add(key)
+                self._schedule_flush()
+                return
 
+            try:
+                await self._persist(key, value)
             except Exception as e:
                 logger.error(f"Failed to persist state {key}: {e}")
                 raise StateError(f"Failed to persist state {key}") from e
 
+    async def _persist(self, key: str, value: Any) -> None:
+        """Write one key's value to its state file (caller holds the lock)."""
+        file_path = self._get_file_path(key)
+        # Small writes happen inline under the per-key lock;
+        # large ones still go through the executor
+        content = json_dumps(value)
+        if len(content) < _SYNC_IO_THRESHOLD:
+            self._write_atomic(file_path, content)
+        else:
+            loop = self._get_loop()
+            await loop.run_in_executor(self._executor, self._write_atomic, file_path, content)
+        logger.debug(f"State persisted: {key}")
+
+    def _schedule_flush(self) -> None:
+        """Arm the deferred flush task if one is not already pending."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._get_loop().create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Persist all dirty keys immediately.
+
+        Deferred-flush failures are logged rather than raised: there is
+        no caller to surface them to, and the value stays dirty so the
+        next flush retries it.
+        """
+        for key in list(self._dirty):
+            async with self._get_lock(key):
+                if key not in self._dirty:
+                    continue
+                try:
+                    await self._persist(key, self._cache[key])
+                    self._dirty.discard(key)
+                except Exception as e:
+                    logger.error(f"Deferred flush failed for state {key}: {e}")
+
     async def delete(self, key: str) -> None:
         """Delete state value by key.
 
@@ -133,13 +218,14 @@ class StateManager:
         async with self._get_lock(key):
             # Remove from cache
             self._cache.pop(key, None)
+            self._dirty.discard(key)
 
             # Remove file
             file_path = self._get_file_path(key)
             if file_path.exists():
                 try:
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, file_path.unlink)
+                    loop = self._get_loop()
+                    await loop.run_in_executor(self._executor, file_path.unlink)
                     logger.debug(f"State deleted: {key}")
                 except Exception as e:
                     logger.warning(f"Failed to delete state file {key}: {e}")
@@ -148,17 +234,23 @@ class StateManager:
         """Clear all state (cache and files)."""
         async with self._global_lock:
             self._cache.clear()
+            self._dirty.clear()
 
-            # Remove all state files
-            for file_path in self.state_dir.glob("*.json"):
-                try:
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, file_path.unlink)
-                except Exception as e:
-                    logger.warning(f"Failed to delete state file {file_path}: {e}")
+            # Remove all state files in a single executor hop instead of
+            # one thread dispatch per file
+            loop = self._get_loop()
+            await loop.run_in_executor(self._executor, self._clear_files_sync)
 
             logger.info("All state cleared")
 
+    def _clear_files_sync(self) -> None:
+        """Unlink every state file synchronously (runs in the executor)."""
+        for file_path in self.state_dir.glob("*.json"):
+            try:
+                file_path.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to delete state file {file_path}: {e}")
+
     def get_sync(self, key: str, default: Any = None) -> Any:
         """Synchronous version of get (cache-only, no file I/O).
 
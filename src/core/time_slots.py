@@ -4,10 +4,17 @@ This module provides elegant time slot parsing and checking functionality.
 """
 
 import logging
+import re
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Matches one whole "start-end" hour pair, tolerating surrounding
+# whitespace; applied with fullmatch per comma-separated piece so
+# malformed input (e.g. "9:00-12:00") is rejected instead of silently
+# mis-parsed from whatever digits happen to appear in it
+_SLOT_RE = re.compile(r"\s*(\d{1,2})\s*-\s*(\d{1,2})\s*")
+
 
 @dataclass(frozen=True)
 class TimeSlot:
@@ -22,11 +29,29 @@ class TimeSlot:
     end: int
 
     def __post_init__(self):
-        """Validate time slot values."""
+        """Validate time slot values and precompute the hour bitmask."""
         if not (0 <= self.start <= 23):
             raise ValueError(f"Start hour must be 0-23, got {self.start}")
         if not (0 <= self.end <= 23):
             raise ValueError(f"End hour must be 0-23, got {self.end}")
+        # 24-bit mask with bit h set iff hour h falls in the slot, so
+        # membership is a branchless shift-and-test at query time
+        object.__setattr__(self, "_mask", self._compute_mask())
+
+    def _compute_mask(self) -> int:
+        """Build the 24-bit membership mask for this slot."""
+        if self.start > self.end:  # Cross-day slot (e.g., 20-8)
+            hours = range(self.start, 24), range(0, self.end)
+        elif self.start == self.end == 0:  # Special case: midnight
+            hours = (range(0, 1),)
+        else:  # Same-day slot
+            hours = (range(self.start, self.end),)
+
+        mask = 0
+        for hour_range in hours:
+            for hour in hour_range:
+                mask |= 1 << hour
+        return mask
 
     def contains(self, hour: int) -> bool:
         """Check if an hour is within this time slot.
@@ -37,12 +62,7 @@ class TimeSlot:
         Returns:
             True if hour is within the slot
         """
-        if self.start > self.end:  # Cross-day slot (e.g., 20-8)
-            return hour >= self.start or hour < self.end
-        elif self.start == self.end == 0:  # Special case: midnight
-            return hour == 0
-        else:  # Same-day slot
-            return self.start <= hour < self.end
+        return bool((self._mask >> hour) & 1)
 
     def __str__(self) -> str:
         return f"{self.start:02d}-{self.end:02d}"
@@ -65,6 +85,12 @@ class TimeSlots:
         """
         self.slots_str = slots_str
         self.slots = self._parse(slots_str)
+        # Union of all per-slot masks: membership across every slot is a
+        # single shift-and-test instead of iterating the slot list
+        mask = 0
+        for slot in self.slots:
+            mask |= slot._mask
+        self._mask = mask
 
     def _parse(self, slots_str: str) -> list[TimeSlot]:
         """Parse time slots string into TimeSlot objects.
@@ -78,29 +104,20 @@ class TimeSlots:
         if not slots_str:
             return []
 
-        slots = []
         try:
-            for slot in slots_str.split(","):
-                slot = slot.strip()
-                if "-" not in slot:
-                    continue
-
-                start_str, end_str = slot.split("-")
-                start = int(start_str)
-                end = int(end_str)
-
+            slots = []
+            for piece in slots_str.split(","):
+                match = _SLOT_RE.fullmatch(piece)
+                if match is None:
+                    raise ValueError(f"invalid slot {piece.strip()!r}")
+                start, end = match.groups()
                 # Handle end=24 as midnight (0)
-                if end == 24:
-                    end = 0
-
-                slots.append(TimeSlot(start, end))
-
+                slots.append(TimeSlot(int(start), 0 if end == "24" else int(end)))
+            return slots
         except (ValueError, AttributeError) as e:
             logger.warning(f"Failed to parse time slots '{slots_str}': {e}")
             return []
 
-        return slots
-
     def contains_hour(self, hour: int) -> bool:
         """Check if an hour is within any of the time slots.
 
@@ -113,7 +130,7 @@ class TimeSlots:
         if not (0 <= hour <= 23):
             raise ValueError(f"Hour must be 0-23, got {hour}")
 
-        return any(slot.contains(hour) for slot in self.slots)
+        return bool((self._mask >> hour) & 1)
 
     def __bool__(self) -> bool:
         """Check if any slots are defined."""
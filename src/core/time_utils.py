@@ -4,6 +4,7 @@ This module provides utilities for handling quiet hours and time-based logic.
 """
 
 import logging
+import time
 
 import pendulum
 
@@ -34,6 +35,10 @@ class QuietHours:
         self.start_hour = start_hour
         self.end_hour = end_hour
         self.timezone = timezone
+        self._is_cross_day = start_hour > end_hour
+        # Per-minute memo: the answer cannot change within a minute, and
+        # pendulum.now() plus the replace() clones are the dominant cost
+        self._memo: tuple[int, tuple[bool, int]] | None = None
 
     def check(self, now: pendulum.DateTime | None = None) -> tuple[bool, int]:
         """Check if current time is within quiet hours.
@@ -46,7 +51,13 @@ class QuietHours:
             - is_quiet: True if currently in quiet hours
             - sleep_seconds: Seconds until quiet hours end (0 if not quiet)
         """
+        minute_key = None
         if now is None:
+            # Memoize by wall-clock minute (only for implicit "now" calls;
+            # explicit timestamps always compute fresh)
+            minute_key = int(time.time()) // 60
+            if self._memo is not None and self._memo[0] == minute_key:
+                return self._memo[1]
             now = pendulum.now(self.timezone)
 
         # Build today's start and end time points
@@ -54,7 +65,7 @@ class QuietHours:
         end_time = now.replace(hour=self.end_hour, minute=0, second=0, microsecond=0)
 
         # Handle cross-day scenarios (e.g., 23:00 to 06:00)
-        if self.start_hour > self.end_hour:
+        if self._is_cross_day:
             if now.hour >= self.start_hour:
                 # It's evening, end time is tomorrow
                 end_time = end_time.add(days=1)
@@ -65,9 +76,13 @@ class QuietHours:
         # Check if within range
         if start_time <= now < end_time:
             sleep_seconds = (end_time - now).total_seconds()
-            return True, int(sleep_seconds)
+            result = (True, int(sleep_seconds))
+        else:
+            result = (False, 0)
 
-        return False, 0
+        if minute_key is not None:
+            self._memo = (minute_key, result)
+        return result
 
     def __repr__(self) -> str:
         return f"QuietHours({self.start_hour:02d}:00-{self.end_hour:02d}:00, {self.timezone})"
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 
 from PIL import Image
@@ -10,6 +11,9 @@ class MockEPDDriver:
     def __init__(self, width: int = 800, height: int = 480):
         self.width = width
         self.height = height
+        # PNG dumps cost a full zlib encode per frame; only pay for them
+        # when explicitly requested via MOCK_EPD_DUMP=1
+        self._dump = os.getenv("MOCK_EPD_DUMP") == "1"
         logger.info(f"Mock EPD initialized with size {width}x{height}")
 
     def init(self, fast: bool = False) -> None:
@@ -24,14 +28,16 @@ class MockEPDDriver:
 
     def display(self, image: Image.Image) -> None:
         logger.info(f"[Mock] Displaying image ({image.width}x{image.height})")
-        # Save to file for debugging
-        output_path = Path("mock_display_output.png")
-        image.save(output_path)
-        logger.info(f"[Mock] Saved display output to {output_path}")
+        if self._dump:
+            # Save to file for debugging
+            output_path = Path("mock_display_output.png")
+            image.save(output_path)
+            logger.info(f"[Mock] Saved display output to {output_path}")
 
     def display_partial(self, image: Image.Image, x: int, y: int, w: int, h: int) -> None:
         logger.info(f"[Mock] Partial display at ({x},{y}) size ({w}x{h})")
-        # For mock, just save the partial image
-        output_path = Path(f"mock_partial_{x}_{y}_{w}x{h}.png")
-        image.save(output_path)
-        logger.info(f"[Mock] Saved partial output to {output_path}")
+        if self._dump:
+            # For mock, just save the partial image
+            output_path = Path(f"mock_partial_{x}_{y}_{w}x{h}.png")
+            image.save(output_path)
+            logger.info(f"[Mock] Saved partial output to {output_path}")
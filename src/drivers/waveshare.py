@@ -168,6 +168,48 @@ class WaveshareEPDDriver:
         else:
             logger.warning(f"Partial display not supported for {self.epd.__class__.__name__}")
 
+    def display_partial_region(
+        self, image: Image.Image, x_start: int, y_start: int, x_end: int, y_end: int
+    ) -> None:
+        """Perform a partial update by packing only the changed region.
+
+        Unlike getbuffer() + display_partial_buffer(), which pack the
+        whole frame and then copy the region out row by row, this crops
+        the region from the image and lets Pillow pack it to 1 bpp
+        directly, so untouched rows are never scanned.
+
+        Args:
+            image: FULL-SIZE PIL Image in landscape orientation (e.g. 800x480)
+            x_start: X coordinate of top-left corner
+            y_start: Y coordinate of top-left corner
+            x_end: X coordinate of bottom-right corner (not width!)
+            y_end: Y coordinate of bottom-right corner (not height!)
+        """
+        if not hasattr(self.epd, "display_Partial"):
+            logger.warning(f"Partial display not supported for {self.epd.__class__.__name__}")
+            return
+
+        # Align X coordinates to 8-pixel boundaries (required by hardware)
+        x_start_aligned = (x_start // 8) * 8
+        x_end_aligned = ((x_end + 7) // 8) * 8
+
+        region = image.crop((x_start_aligned, y_start, x_end_aligned, y_end))
+        if region.mode != "1":
+            region = region.convert("1")
+
+        # Mode "1" packs MSB-first at 1 bit per pixel with rows padded to
+        # whole bytes; with 8-aligned X bounds this is exactly the layout
+        # display_Partial expects
+        partial_buffer = bytearray(region.tobytes())
+
+        logger.debug(
+            f"Partial refresh (region pack): region ({x_start},{y_start})-({x_end},{y_end}), "
+            f"aligned ({x_start_aligned},{y_start})-({x_end_aligned},{y_end}), "
+            f"buffer size: {len(partial_buffer)} bytes"
+        )
+
+        self.epd.display_Partial(partial_buffer, x_start_aligned, y_start, x_end_aligned, y_end)
+
     def init_part(self) -> None:
         """Initialize partial refresh mode if supported."""
         if hasattr(self.epd, "init_part"):
@@ -3,7 +3,7 @@
 import logging
 from typing import Any
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from ...renderer.dashboard import DashboardRenderer
 from ..utils.layout_helper import LayoutConstants, LayoutHelper
@@ -20,6 +20,36 @@ class FooterComponent:
         self.FOOTER_CENTER_Y = 410
         self.FOOTER_LABEL_Y = 445
 
+        # Cross-divider geometry for the GitHub stats slot
+        self._cross_offset_x = 25
+        self._cross_offset_y = 15
+        h_length = (self._cross_offset_x + 15) * 2
+        v_length = (self._cross_offset_y + 10) * 2
+
+        # Quadrant placement for the GitHub stats: (dx, dy, key) relative
+        # to the slot center, computed once instead of per frame
+        ox, oy = self._cross_offset_x, self._cross_offset_y
+        self._cross_quadrants = (
+            (-ox, -oy, "day"),
+            (ox, -oy, "week"),
+            (-ox, oy, "month"),
+            (ox, oy, "year"),
+        )
+
+        # Pre-rasterized cross divider: pasting this cached mask replaces
+        # two ImageDraw.line calls on every frame
+        self._cross_mask = Image.new("1", (h_length + 1, v_length + 1), 0)
+        mask_draw = ImageDraw.Draw(self._cross_mask)
+        mask_draw.line((0, v_length // 2, h_length, v_length // 2), fill=1, width=1)
+        mask_draw.line((h_length // 2, 0, h_length // 2, v_length), fill=1, width=1)
+
+        # Slot-type dispatch built once: avoids an if/elif chain per slot
+        self._dispatch = {
+            "ring": self._draw_ring_item,
+            "cross": self._draw_cross_item,
+            "text": self._draw_text_item,
+        }
+
     def draw(
         self,
         draw: ImageDraw.ImageDraw,
@@ -39,50 +69,52 @@ class FooterComponent:
             btc_data: Bitcoin price data
             week_prog: Week progress percentage
         """
+        # Hoist hot attribute lookups out of the slot loop
         r = self.renderer
+        draw_text = r.draw_centered_text
+        font_s = r.font_s
+        label_y = self.FOOTER_LABEL_Y
+        dispatch = self._dispatch
 
         # Construct BTC string
         btc_val = f"${btc_data.get('usd', 0):,}"
         change = btc_data.get("usd_24h_change", 0.0)
         btc_label = f"BTC ({change:+.1f}%)"
 
-        # Define footer components
-        footer_items = [
-            {"label": "Weekly", "value": week_prog, "type": "ring"},
-            {"label": "Commits", "value": commits, "type": "cross"},
-            {"label": btc_label, "value": btc_val, "type": "text"},
-            {"label": "VPS Data", "value": vps_data, "type": "ring"},
-        ]
+        # Define footer components: plain tuples, no per-frame dicts
+        footer_items = (
+            ("Weekly", week_prog, "ring"),
+            ("Commits", commits, "cross"),
+            (btc_label, btc_val, "text"),
+            ("VPS Data", vps_data, "ring"),
+        )
 
         # Calculate dynamic layout using LayoutHelper
         col_layout = self.layout.create_column_layout(
             width, len(footer_items), padding=LayoutConstants.MARGIN_SMALL
         )
+        get_column_center = col_layout.get_column_center
 
         # Loop to draw components
-        for i, item in enumerate(footer_items):
-            center_x = col_layout.get_column_center(i)
+        for i, (label, value, item_type) in enumerate(footer_items):
+            center_x = get_column_center(i)
 
             # Draw label
-            r.draw_centered_text(
+            draw_text(
                 draw,
                 center_x,
-                self.FOOTER_LABEL_Y,
-                item["label"],
-                font=r.font_s,
+                label_y,
+                label,
+                font=font_s,
                 align_y_center=False,
             )
 
-            # Draw value based on type
-            if item["type"] == "ring":
-                self._draw_ring_item(draw, center_x, item["value"])
-            elif item["type"] == "cross":
-                self._draw_cross_item(draw, center_x, item["value"])
-            elif item["type"] == "text":
-                self._draw_text_item(draw, center_x, str(item["value"]))
-            else:
-                logger.warning(f"Unknown footer item type: {item['type']}")
-                self._draw_text_item(draw, center_x, str(item["value"]))
+            # Draw value via the type dispatch table
+            draw_fn = dispatch.get(item_type)
+            if draw_fn is None:
+                logger.warning(f"Unknown footer item type: {item_type}")
+                draw_fn = self._draw_text_item
+            draw_fn(draw, center_x, value)
 
     def _draw_ring_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: int) -> None:
         """Draw a ring progress item."""
@@ -105,14 +137,14 @@ class FooterComponent:
             align_y_center=True,
         )
 
-    def _draw_text_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: str) -> None:
+    def _draw_text_item(self, draw: ImageDraw.ImageDraw, center_x: int, value: Any) -> None:
         """Draw a simple text item."""
         r = self.renderer
         r.draw_centered_text(
             draw,
             center_x,
             self.FOOTER_CENTER_Y,
-            value,
+            str(value),
             font=r.font_date_big,
             align_y_center=True,
         )
@@ -129,56 +161,27 @@ class FooterComponent:
             and "month" in value
             and "year" in value
         ):
-            offset_x = 25
-            offset_y = 15
-
-            # Top-left: Day
-            r.draw_centered_text(
-                draw,
-                center_x - offset_x,
-                self.FOOTER_CENTER_Y - offset_y,
-                str(value["day"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
-
-            # Top-right: Week
-            r.draw_centered_text(
-                draw,
-                center_x + offset_x,
-                self.FOOTER_CENTER_Y - offset_y,
-                str(value["week"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
-
-            # Bottom-left: Month
-            r.draw_centered_text(
-                draw,
-                center_x - offset_x,
-                self.FOOTER_CENTER_Y + offset_y,
-                str(value["month"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
-
-            # Bottom-right: Year
-            r.draw_centered_text(
-                draw,
-                center_x + offset_x,
-                self.FOOTER_CENTER_Y + offset_y,
-                str(value["year"]),
-                font=r.font_commits,
-                align_y_center=True,
-            )
-
-            # Draw cross lines using LayoutHelper
-            self.layout.draw_cross_divider(
-                draw,
-                center_x,
-                self.FOOTER_CENTER_Y,
-                h_length=(offset_x + 15) * 2,
-                v_length=(offset_y + 10) * 2,
+            draw_text = r.draw_centered_text
+            font_commits = r.font_commits
+            center_y = self.FOOTER_CENTER_Y
+
+            # Day / week / month / year in the four quadrants
+            for dx, dy, key in self._cross_quadrants:
+                draw_text(
+                    draw,
+                    center_x + dx,
+                    center_y + dy,
+                    str(value[key]),
+                    font=font_commits,
+                    align_y_center=True,
+                )
+
+            # Blit the pre-rasterized cross lines through their mask
+            mask = self._cross_mask
+            draw._image.paste(
+                self.layout.COLOR_BLACK,
+                (center_x - mask.width // 2, self.FOOTER_CENTER_Y - mask.height // 2),
+                mask,
             )
         else:
             # Fallback to text if not a valid dict
@@ -7,6 +7,7 @@ from PIL import ImageDraw
 
 from ...config import Config
 from ...renderer.dashboard import DashboardRenderer
+from ...types import HackerNewsStory
 from ..utils.layout_helper import LayoutConstants, LayoutHelper
 
 logger = logging.getLogger(__name__)
@@ -57,8 +58,13 @@ class HackerNewsComponent:
         # Draw stories
         for i, story in enumerate(stories):
             y = self.LIST_START_Y + i * self.LINE_H
-            title = story.get("title", "")
-            score = story.get("score", 0)
+            if isinstance(story, HackerNewsStory):
+                title = story.title
+                score = story.score
+            else:
+                # Legacy dict entries (old list format)
+                title = story.get("title", "")
+                score = story.get("score", 0)
 
             global_idx = start_idx + i
             left_text = f"{global_idx}. {title}"
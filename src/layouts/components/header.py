@@ -1,5 +1,7 @@
 """Header component for dashboard layout."""
 
+import datetime
+import functools
 import logging
 from typing import Any
 
@@ -12,6 +14,17 @@ from ..utils.layout_helper import LayoutConstants, LayoutHelper
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _date_labels(ordinal: int) -> tuple[str, str]:
+    """Format the header date strings once per calendar day.
+
+    The dashboard redraws many times a day with the same date, so the
+    three strftime calls are memoized on the date's ordinal.
+    """
+    d = datetime.date.fromordinal(ordinal)
+    return f"{d.strftime('%a')}, {d.strftime('%d')}", d.strftime("%b %Y")
+
+
 class HeaderComponent:
     """Handles rendering of the dashboard header section."""
 
@@ -122,19 +135,17 @@ class HeaderComponent:
 
             case "date":
                 data = item_data["data"]
-                weekday = data.strftime("%a")
-                day = data.strftime("%d")
+                day_label, month_year = _date_labels(data.toordinal())
                 r.draw_centered_text(
                     draw,
                     center_x,
                     top_y,
-                    f"{weekday}, {day}",
+                    day_label,
                     font=r.font_date_big,
                     fill=r.COLOR_BLACK,
                     align_y_center=False,
                 )
 
-                month_year = data.strftime("%b %Y")
                 r.draw_centered_text(
                     draw,
                     center_x,
@@ -10,7 +10,7 @@ import logging
 from PIL import Image, ImageDraw
 
 from ..config import Config
-from ..renderer.dashboard import DashboardRenderer
+from ..renderer.dashboard import get_renderer
 from .components.footer import FooterComponent
 from .components.hackernews import HackerNewsComponent
 from .components.header import HeaderComponent
@@ -28,7 +28,7 @@ class DashboardLayout:
     """
 
     def __init__(self):
-        self.renderer = DashboardRenderer()
+        self.renderer = get_renderer()
 
         # Initialize components
         self.header = HeaderComponent(self.renderer)
@@ -37,6 +37,13 @@ class DashboardLayout:
         self.todo_list = TodoListComponent(self.renderer)
         self.year_end = YearEndSummaryComponent(self.renderer)
 
+        # Reusable (canvas, draw) pair per (width, height, mode):
+        # Image.new allocates and fills the whole raster, which is
+        # wasted work when the next refresh repaints every section
+        # anyway, and the Draw object is tied to the canvas identity so
+        # it can be reused with it
+        self._canvas_cache: dict[tuple[int, int, str], tuple[Image.Image, ImageDraw.ImageDraw]] = {}
+
         # Legacy attributes for backward compatibility if needed
         self._current_hackernews = []
         self._current_goals = Config.LIST_GOALS
@@ -52,12 +59,22 @@ class DashboardLayout:
             data: Dictionary containing all display data
 
         Returns:
-            PIL Image object (mode "L" for grayscale or "1" for B/W)
+            PIL Image object (mode "L" for grayscale or "1" for B/W).
+            The canvas is reused across calls — it stays valid until the
+            next create_image call; callers that keep a frame around
+            must .copy() it.
         """
-        # Create canvas with appropriate mode
+        # Get (or create) the reusable canvas and wipe it to white
         image_mode = "L" if Config.hardware.use_grayscale else "1"
-        image = Image.new(image_mode, (width, height), 255)
-        draw = ImageDraw.Draw(image)
+        key = (width, height, image_mode)
+        cached_canvas = self._canvas_cache.get(key)
+        if cached_canvas is None:
+            image = Image.new(image_mode, (width, height), 255)
+            draw = ImageDraw.Draw(image)
+            self._canvas_cache[key] = (image, draw)
+        else:
+            image, draw = cached_canvas
+            image.paste(255, (0, 0, width, height))
 
         # Extract data
         now = datetime.datetime.now()
@@ -10,7 +10,7 @@ import os
 
 from PIL import Image, ImageDraw, ImageFont
 
-from ..renderer.dashboard import DashboardRenderer
+from ..renderer.dashboard import get_renderer
 from ..utils.fonts import FontManager
 from .utils.layout_helper import LayoutConstants, LayoutHelper
 
@@ -22,7 +22,7 @@ class PoetryLayout:
 
     def __init__(self):
         """Initialize poetry layout with renderer."""
-        self.renderer = DashboardRenderer()
+        self.renderer = get_renderer()
         self.layout = LayoutHelper(use_grayscale=False)
 
         # Resolve fonts using FontManager
@@ -8,7 +8,7 @@ import textwrap
 
 from PIL import Image, ImageDraw
 
-from ..renderer.dashboard import DashboardRenderer
+from ..renderer.dashboard import get_renderer
 from .utils.layout_helper import LayoutConstants, LayoutHelper
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ class QuoteLayout:
 
     def __init__(self):
         """Initialize quote layout with renderer."""
-        self.renderer = DashboardRenderer()
+        self.renderer = get_renderer()
         self.layout = LayoutHelper(use_grayscale=False)
 
     def create_quote_image(self, width: int, height: int, quote: dict) -> Image.Image:
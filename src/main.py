@@ -20,6 +20,8 @@ try:
         QuietHours,
         TaskManager,
         TimeSlots,
+        close_http_client,
+        display_lock,
     )
     from .core.data_fetcher import DataFetcher
     from .drivers.factory import get_driver
@@ -37,6 +39,8 @@ except ImportError:
         QuietHours,
         TaskManager,
         TimeSlots,
+        close_http_client,
+        display_lock,
     )
     from src.core.data_fetcher import DataFetcher
     from src.drivers.factory import get_driver
@@ -122,16 +126,20 @@ async def update_display(epd, image: Any, config_changed: asyncio.Event) -> None
             config_changed.clear()
             return
 
-        # Initialize display
-        epd.init()
-        logger.info("🖼️  Updating display...")
+        # Hold the shared EPD lock for the whole init/display/sleep
+        # sequence so a partial refresh task can't drive the SPI bus
+        # (or get powered down) mid-transfer
+        async with display_lock:
+            # Initialize display
+            epd.init()
+            logger.info("🖼️  Updating display...")
 
-        # Display image
-        epd.display(image)
-        logger.info("✅ Display updated successfully")
+            # Display image
+            epd.display(image)
+            logger.info("✅ Display updated successfully")
 
-        # Put display to sleep to save power
-        epd.sleep()
+            # Put display to sleep to save power
+            epd.sleep()
 
     except Exception as e:
         logger.error(f"Failed to update display: {e}")
@@ -291,6 +299,7 @@ async def main():
         logger.error(f"Fatal error: {e}", exc_info=True)
         raise
     finally:
+        await close_http_client()
         stop_config_watcher()
         if _driver:
             try:
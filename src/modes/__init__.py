@@ -4,12 +4,12 @@ This module demonstrates how to create display modes using the new plugin archit
 These can serve as templates for creating new display modes.
 """
 
-import httpx
 import pendulum
 from PIL import Image, ImageDraw
 
 from src.config import Config
 from src.core.display_mode import DisplayMode, register_mode
+from src.core.http import get_http_client
 from src.layouts.holiday import HolidayManager
 from src.layouts.poetry import PoetryLayout
 from src.layouts.quote import QuoteLayout
@@ -113,9 +113,8 @@ class QuoteMode(DisplayMode):
 
     async def fetch_data(self, **kwargs) -> dict:
         """Fetch quote data."""
-        async with httpx.AsyncClient() as client:
-            quote = await get_quote(client)
-            return {"quote": quote}
+        quote = await get_quote(get_http_client())
+        return {"quote": quote}
 
     def render(self, width: int, height: int, data: dict) -> Image.Image:
         """Render quote."""
@@ -137,9 +136,8 @@ class PoetryMode(DisplayMode):
 
     async def fetch_data(self, **kwargs) -> dict:
         """Fetch poetry data."""
-        async with httpx.AsyncClient() as client:
-            poetry = await get_poetry(client)
-            return {"poetry": poetry}
+        poetry = await get_poetry(get_http_client())
+        return {"poetry": poetry}
 
     def render(self, width: int, height: int, data: dict) -> Image.Image:
         """Render poetry."""
@@ -5,14 +5,15 @@ Individual providers are in separate modules for better organization.
 """
 
 import asyncio
-import json
 import logging
+import os
 
 import httpx
 import pendulum
 
 from ..config import Config
 from ..core.cache import cached
+from ..core.serialization import json_dumps, json_loads
 from ..exceptions import ProviderError
 from .btc import get_btc_data
 from .vps import get_vps_info
@@ -24,6 +25,18 @@ logger = logging.getLogger(__name__)
 
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
+# Fallback values per dashboard key, used when a provider fails and the
+# cache has nothing for it; keys map to the task names used below
+_DEFAULTS = {
+    "weather": ("weather", {}),
+    "github_commits": ("github", 0),
+    "vps_usage": ("vps", 0),
+    "btc_price": ("btc", {}),
+}
+
+# Soft per-provider timeout so one slow API cannot hold up the batch
+_PROVIDER_TIMEOUT = 15.0
+
 
 # ===== GitHub Provider (kept here due to complexity) =====
 
@@ -304,21 +317,41 @@ class Dashboard:
         if not self.cache_file.exists():
             return {}
         try:
-            with open(self.cache_file) as f:
-                return json.load(f)
+            return json_loads(self.cache_file.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
             return {}
 
+    @staticmethod
+    def _cache_payload(data):
+        """Return ``data`` with HackerNews stories as plain dicts.
+
+        The live payload carries HackerNewsStory NamedTuples, which
+        orjson refuses to serialize (and the stdlib would flatten into
+        bare arrays that don't round-trip). Copy-on-write: the live
+        dict handed to the renderer is never mutated.
+        """
+        stories = data.get("hackernews", {}).get("stories")
+        if not stories or isinstance(stories[0], dict):
+            return data
+        hackernews = {**data["hackernews"], "stories": [s._asdict() for s in stories]}
+        return {**data, "hackernews": hackernews}
+
     def save_cache(self, data):
-        """Save data to cache file."""
+        """Save data to cache file (atomic tmp + rename)."""
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, "w") as f:
-                json.dump(data, indent=2, fp=f)
+            tmp_path = self.cache_file.with_suffix(".json.tmp")
+            tmp_path.write_bytes(json_dumps(self._cache_payload(data)))
+            os.replace(tmp_path, self.cache_file)
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
 
+    async def save_cache_async(self, data):
+        """Save the cache off-loop so JSON encode + write can't block rendering."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.save_cache, data)
+
     async def fetch_year_end_data(self) -> dict:
         """Fetch data specifically for year-end summary."""
         logger.info("Fetching year-end summary data")
@@ -364,76 +397,87 @@ class Dashboard:
             "show_hackernews": show_hackernews,
         }
 
-        # Fetch all data concurrently
+        # Fetch all data concurrently (including the slot-dependent TODO
+        # or HackerNews fetch), consuming results in completion order
         if self.client:
-            async with asyncio.TaskGroup() as tg:
-                tasks = {}
-                tasks["weather"] = tg.create_task(get_weather(self.client))
-                tasks["github"] = tg.create_task(get_github_commits(self.client))
-                tasks["vps"] = tg.create_task(get_vps_info(self.client))
-                tasks["btc"] = tg.create_task(get_btc_data(self.client))
+            results = await self._fetch_providers(self.client, show_todo)
         else:
             async with httpx.AsyncClient() as client:
-                async with asyncio.TaskGroup() as tg:
-                    tasks = {}
-                    tasks["weather"] = tg.create_task(get_weather(client))
-                    tasks["github"] = tg.create_task(get_github_commits(client))
-                    tasks["vps"] = tg.create_task(get_vps_info(client))
-                    tasks["btc"] = tg.create_task(get_btc_data(client))
-
-        # Get results with cache fallback
-        data["weather"] = self._get_with_cache_fallback(tasks["weather"], "weather", {})
-        data["github_commits"] = self._get_with_cache_fallback(tasks["github"], "github_commits", 0)
-        data["vps_usage"] = self._get_with_cache_fallback(tasks["vps"], "vps_usage", 0)
-        data["btc_price"] = self._get_with_cache_fallback(tasks["btc"], "btc_price", {})
+                results = await self._fetch_providers(client, show_todo)
+
+        # Apply results with cache fallback, driven by the defaults table;
+        # the cache file is read once, not once per key
+        cache = self.load_cache()
+        for key, (task_name, default) in _DEFAULTS.items():
+            data[key] = self._get_with_cache_fallback(results[task_name], key, cache, default)
 
         # Calculate week progress
         data["week_progress"] = get_week_progress()
 
-        # Conditionally fetch TODO lists based on time slots
         if show_todo:
-            from .todo import get_todo_lists
-
-            todo_goals, todo_must, todo_optional = await get_todo_lists()
-            data["todo_goals"] = todo_goals
-            data["todo_must"] = todo_must
-            data["todo_optional"] = todo_optional
+            todo_result = results["todo"]
+            if isinstance(todo_result, Exception):
+                logger.error(f"Failed to fetch TODO lists: {todo_result}")
+                todo_result = ([], [], [])
+            data["todo_goals"], data["todo_must"], data["todo_optional"] = todo_result
             logger.info("📝 Fetched Todo Lists")
-
-            # Clear HackerNews data during TODO time
-            data["hackernews"] = {}
         else:
-            # Fetch HackerNews data only during HackerNews time slots
-            from .hackernews import get_hackernews
-
-            if self.client:
-                hn_data = await get_hackernews(self.client, reset_to_first=False)
-            else:
-                async with httpx.AsyncClient() as client:
-                    hn_data = await get_hackernews(client, reset_to_first=False)
-
+            hn_data = results["hackernews"]
+            if isinstance(hn_data, Exception):
+                logger.error(f"Failed to fetch HackerNews: {hn_data}")
+                hn_data = {}
             data["hackernews"] = hn_data
             logger.info(
                 f"📰 Fetched HackerNews: Page {hn_data.get('page', 1)}/{hn_data.get('total_pages', 1)}"
             )
 
-            # Clear TODO data during HackerNews time
-            data["todo_goals"] = []
-            data["todo_must"] = []
-            data["todo_optional"] = []
-
-        self.save_cache(data)
+        await self.save_cache_async(data)
         return data
 
-    def _get_with_cache_fallback(self, task, key, default):
-        """Get result from task, use cache on failure."""
-        try:
-            result = task.result()
-            cache = self.load_cache()
-            cache[key] = result
-            self.save_cache(cache)
-            return result
-        except Exception as e:
-            logger.error(f"Failed to fetch {key}: {e}, using cache")
-            cache = self.load_cache()
+    async def _fetch_providers(self, client: httpx.AsyncClient, show_todo: bool = False) -> dict:
+        """Run all dashboard providers concurrently.
+
+        Results are consumed as each provider finishes; failures and
+        timeouts come back as exception values instead of aborting the
+        whole batch, so the cache fallback can handle them per key.
+        """
+
+        async def run(name, fetch):
+            try:
+                return name, await asyncio.wait_for(fetch(client), _PROVIDER_TIMEOUT)
+            except Exception as e:
+                return name, e
+
+        from .hackernews import get_hackernews
+        from .todo import get_todo_lists
+
+        fetchers = {
+            "weather": get_weather,
+            "github": get_github_commits,
+            "vps": get_vps_info,
+            "btc": get_btc_data,
+        }
+        # The slot-dependent middle section joins the same batch so its
+        # latency overlaps the other providers instead of adding to them
+        if show_todo:
+            fetchers["todo"] = lambda c: get_todo_lists()
+        else:
+            fetchers["hackernews"] = lambda c: get_hackernews(c, reset_to_first=False)
+
+        results = {}
+        for future in asyncio.as_completed([run(n, f) for n, f in fetchers.items()]):
+            name, result = await future
+            results[name] = result
+            logger.debug(f"Provider finished: {name}")
+        return results
+
+    def _get_with_cache_fallback(self, result, key, cache, default):
+        """Apply a provider result, falling back to cache on failure.
+
+        Successful results are not written here: the final
+        save_cache_async call persists the full payload once.
+        """
+        if isinstance(result, Exception):
+            logger.error(f"Failed to fetch {key}: {result}, using cache")
             return cache.get(key, default)
+        return result
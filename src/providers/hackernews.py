@@ -8,10 +8,11 @@ import asyncio
 import logging
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from src.config import Config
 from src.core.cache import cached
+from src.core.retry import api_retry
+from src.core.serialization import json_loads
 from src.core.state import StateManager
 from src.exceptions import ProviderError
 from src.types import HackerNewsData, HackerNewsStory
@@ -22,8 +23,9 @@ logger = logging.getLogger(__name__)
 HN_BEST_STORIES_URL = "https://hacker-news.firebaseio.com/v0/beststories.json"
 HN_ITEM_URL = "https://hacker-news.firebaseio.com/v0/item/{}.json"
 
-# State manager instance
-_state_manager = StateManager(Config.DATA_DIR)
+# State manager instance; the page counter flips every rotation and
+# tolerates losing a minute of position, so coalesce its disk writes
+_state_manager = StateManager(Config.DATA_DIR, flush_interval=60.0)
 
 
 @cached(ttl=Config.display.hackernews_refresh_minutes * 60, maxsize=1)
@@ -42,40 +44,43 @@ async def _fetch_all_stories(client: httpx.AsyncClient) -> list[HackerNewsStory]
     try:
         logger.info("Fetching Hacker News best stories...")
 
-        # Fetch ALL story IDs
-        response = await client.get(HN_BEST_STORIES_URL, timeout=10.0)
-        response.raise_for_status()
-        story_ids = response.json()
+        # Fetch ALL story IDs (the one call worth retrying: without the
+        # ID list there is nothing to display)
+        story_ids = await _fetch_best_story_ids(client)
 
-        # Limit to top 50 stories to avoid fetching too much data
-        # 50 stories = 10 pages of 5 stories each, which is plenty
-        limit = 50
+        # Only fetch what pagination can ever display: per_page stories
+        # across at most hackernews_max_pages pages
+        limit = Config.display.hackernews_stories_per_page * Config.display.hackernews_max_pages
         story_ids = story_ids[:limit]
 
         logger.info(f"Fetching details for top {len(story_ids)} HN stories...")
 
-        # Use a semaphore to limit concurrent requests
-        sem = asyncio.Semaphore(10)
+        # Use a semaphore to limit concurrent requests; HN's Firebase
+        # endpoint comfortably handles 20 parallel sockets
+        sem = asyncio.Semaphore(20)
 
         async def fetch_with_sem(sid: int) -> dict | None:
             async with sem:
                 return await _fetch_story(client, sid)
 
-        # Fetch stories concurrently
-        results = await asyncio.gather(*[fetch_with_sem(sid) for sid in story_ids])
+        # Fetch stories concurrently; a single failed item must not
+        # take down the whole batch
+        results = await asyncio.gather(
+            *[fetch_with_sem(sid) for sid in story_ids], return_exceptions=True
+        )
 
         # Process results
         stories: list[HackerNewsStory] = []
         for i, story in enumerate(results):
-            if not story:
+            if not story or isinstance(story, BaseException):
                 continue
 
             stories.append(
-                {
-                    "id": story_ids[i],
-                    "title": story.get("title", ""),
-                    "score": story.get("score", 0),
-                }
+                HackerNewsStory(
+                    id=story_ids[i],
+                    title=story.get("title", ""),
+                    score=story.get("score", 0),
+                )
             )
 
         if not stories:
@@ -93,10 +98,20 @@ async def _fetch_all_stories(client: httpx.AsyncClient) -> list[HackerNewsStory]
         raise ProviderError("hackernews", "Unexpected error", e) from e
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+@api_retry
+async def _fetch_best_story_ids(client: httpx.AsyncClient) -> list[int]:
+    """Fetch the best-stories ID list (retried on transient HTTP errors)."""
+    response = await client.get(HN_BEST_STORIES_URL, timeout=10.0)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
 async def _fetch_story(client: httpx.AsyncClient, story_id: int) -> dict | None:
     """Fetch a single story from Hacker News API.
 
+    No per-item retry: a failed story is simply skipped by the caller,
+    which keeps worst-case batch latency bounded under partial outages.
+
     Args:
         client: HTTP client instance
         story_id: Story ID to fetch
@@ -107,7 +122,10 @@ async def _fetch_story(client: httpx.AsyncClient, story_id: int) -> dict | None:
     try:
         response = await client.get(HN_ITEM_URL.format(story_id), timeout=10.0)
         response.raise_for_status()
-        return response.json()
+        # Decode through the shared serialization shim: with the
+        # 'performance' extra installed this is orjson, and it runs
+        # once per story so the speedup compounds across the fan-out
+        return json_loads(response.content)
     except Exception as e:
         logger.warning(f"Failed to fetch HN story {story_id}: {e}")
         return None
@@ -151,7 +169,7 @@ async def get_hackernews(
     except ProviderError:
         # Return empty result on error
         return {
-            "stories": [],
+            "stories": (),
             "page": 1,
             "total_pages": 1,
             "start_idx": 1,
@@ -160,7 +178,7 @@ async def get_hackernews(
 
     if not stories:
         return {
-            "stories": [],
+            "stories": (),
             "page": 1,
             "total_pages": 1,
             "start_idx": 1,
@@ -180,8 +198,9 @@ async def get_hackernews(
     start_idx = (current_page - 1) * per_page + 1
     end_idx = min(current_page * per_page, len(stories))
 
-    # Get current page stories
-    page_stories = stories[start_idx - 1 : end_idx]
+    # Get current page stories as an immutable view, so downstream
+    # components can't accidentally mutate the cached story list's items
+    page_stories = tuple(stories[start_idx - 1 : end_idx])
 
     # Save state
     await _state_manager.set("hackernews_page", current_page)
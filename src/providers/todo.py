@@ -4,14 +4,69 @@ Supports multiple TODO sources including Gist, Notion, Google Sheets,
 and local configuration. Falls back to config if external sources fail.
 """
 
+import asyncio
 import logging
-
-import httpx
+import re
 
 from ..config import Config
+from ..core.cache import cached
+from ..core.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Markdown TODO grammar as one combined MULTILINE pattern: headings and
+# list items (with an optional GitHub task checkbox) are distinguished
+# by which named group matched, so the whole document is scanned in a
+# single C-level finditer pass instead of a Python loop over lines.
+# The checkbox group is possessive (?+) so a bare "- [ ]" with no text
+# cannot backtrack into matching the brackets as the item text; such
+# empty items are simply skipped
+_TODO_LINE_RE = re.compile(
+    r"^[ \t]*(?:#+[ \t]*(?P<title>.+?)|[-*][ \t]+(?:\[(?P<check>[ xX])\][ \t]*)?+(?P<item>.+?))[ \t\r]*$",
+    re.MULTILINE,
+)
+
+# Lazily cached blocking clients, keyed by their credentials so a config
+# reload with new secrets rebuilds them instead of reusing stale auth
+_notion_client: tuple[str, object] | None = None
+_gspread_client: tuple[str, object] | None = None
+
+
+def _get_notion_client():
+    """Get a cached notion_client.Client, re-authing only when the token changes."""
+    global _notion_client
+    from notion_client import Client
+
+    token = Config.NOTION_TOKEN
+    if _notion_client is None or _notion_client[0] != token:
+        _notion_client = (token, Client(auth=token))
+    return _notion_client[1]
+
+
+def _get_gspread_client():
+    """Get a cached gspread service-account client for the configured credentials."""
+    global _gspread_client
+    import gspread
+
+    credentials = Config.GOOGLE_CREDENTIALS_FILE
+    if _gspread_client is None or _gspread_client[0] != credentials:
+        _gspread_client = (credentials, gspread.service_account(filename=credentials))
+    return _gspread_client[1]
+
+
+def _query_notion_sync() -> dict:
+    """Blocking Notion database query (runs in a worker thread)."""
+    return _get_notion_client().databases.query(
+        database_id=Config.NOTION_DATABASE_ID,
+        filter={"property": "Status", "select": {"equals": "Active"}},
+    )
+
+
+def _read_sheet_sync() -> list[list[str]]:
+    """Blocking Google Sheets read (runs in a worker thread)."""
+    sheet = _get_gspread_client().open_by_key(Config.GOOGLE_SHEETS_ID).sheet1
+    return sheet.get_all_values()
+
 
 async def get_todo_lists() -> tuple[list[str], list[str], list[str]]:
     """
@@ -23,20 +78,26 @@ async def get_todo_lists() -> tuple[list[str], list[str], list[str]]:
     source = Config.TODO_SOURCE.lower()
 
     try:
-        match source:
-            case "gist":
-                return await get_todo_from_gist()
-            case "notion":
-                return await get_todo_from_notion()
-            case "sheets":
-                return await get_todo_from_sheets()
-            case _:
-                return get_todo_from_config()
+        if source in _REMOTE_SOURCES:
+            return await _get_todo_remote(source)
+        return get_todo_from_config()
     except Exception as e:
         logger.error(f"Failed to fetch TODO from {source}: {e}, using config")
         return get_todo_from_config()
 
 
+@cached(ttl=600, maxsize=3)
+async def _get_todo_remote(source: str) -> tuple[list[str], list[str], list[str]]:
+    """Fetch TODO lists from a remote source, cached per source.
+
+    TODO content changes on human timescales, not per refresh, so a
+    10-minute TTL drops one network round-trip from most dashboard
+    refreshes. Failures raise before anything is cached, and the
+    config source stays uncached so hot reloads show up immediately.
+    """
+    return await _REMOTE_SOURCES[source]()
+
+
 def get_todo_from_config() -> tuple[list[str], list[str], list[str]]:
     """从配置文件获取 TODO 列表（默认/回退方案）"""
     return (
@@ -70,43 +131,43 @@ async def get_todo_from_gist() -> tuple[list[str], list[str], list[str]]:
     url = f"https://api.github.com/gists/{Config.GIST_ID}"
     headers = {"Authorization": f"token {Config.GITHUB_TOKEN}"}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            res = await client.get(url, headers=headers, timeout=10)
-            res.raise_for_status()
-
-            logger.info(f"✅ Successfully fetched gist {Config.GIST_ID}")
-
-            data = res.json()
-            # 查找 todo.md 或第一个 .md 文件
-            files = data.get("files", {})
-            logger.info(f"📁 Files in gist: {list(files.keys())}")
-            content = None
-
-            if "todo.md" in files:
-                content = files["todo.md"]["content"]
-                logger.info(f"📄 Found todo.md, content length: {len(content)} chars")
-            else:
-                # 使用第一个 markdown 文件
-                for filename, file_data in files.items():
-                    if filename.endswith(".md"):
-                        content = file_data["content"]
-                        logger.info(f"📄 Using {filename}, content length: {len(content)} chars")
-                        break
-
-            if content:
-                result = parse_markdown_todo(content)
-                logger.info(
-                    f"✅ Parsed TODO from gist: {len(result[0])} goals, {len(result[1])} must, {len(result[2])} optional"
-                )
-                return result
-            else:
-                logger.warning("⚠️ No markdown file found in gist, falling back to config")
-                return get_todo_from_config()
+    client = get_http_client()
+    try:
+        res = await client.get(url, headers=headers, timeout=10)
+        res.raise_for_status()
+
+        logger.info(f"✅ Successfully fetched gist {Config.GIST_ID}")
+
+        data = res.json()
+        # 查找 todo.md 或第一个 .md 文件
+        files = data.get("files", {})
+        logger.info(f"📁 Files in gist: {list(files.keys())}")
+        content = None
+
+        if "todo.md" in files:
+            content = files["todo.md"]["content"]
+            logger.info(f"📄 Found todo.md, content length: {len(content)} chars")
+        else:
+            # 使用第一个 markdown 文件
+            for filename, file_data in files.items():
+                if filename.endswith(".md"):
+                    content = file_data["content"]
+                    logger.info(f"📄 Using {filename}, content length: {len(content)} chars")
+                    break
+
+        if content:
+            result = parse_markdown_todo(content)
+            logger.info(
+                f"✅ Parsed TODO from gist: {len(result[0])} goals, {len(result[1])} must, {len(result[2])} optional"
+            )
+            return result
+        else:
+            logger.warning("⚠️ No markdown file found in gist, falling back to config")
+            return get_todo_from_config()
 
-        except Exception as e:
-            logger.error(f"❌ Failed to fetch gist: {e}")
-            raise
+    except Exception as e:
+        logger.error(f"❌ Failed to fetch gist: {e}")
+        raise
 
 
 async def get_todo_from_notion() -> tuple[list[str], list[str], list[str]]:
@@ -123,19 +184,15 @@ async def get_todo_from_notion() -> tuple[list[str], list[str], list[str]]:
         return get_todo_from_config()
 
     try:
-        from notion_client import Client
+        import notion_client  # noqa: F401
     except ImportError:
         logger.error("notion-client not installed. Run: pip install notion-client")
         return get_todo_from_config()
 
-    notion = Client(auth=Config.NOTION_TOKEN)
-
     try:
-        # 查询数据库，只获取 Active 状态的项目
-        response = notion.databases.query(
-            database_id=Config.NOTION_DATABASE_ID,
-            filter={"property": "Status", "select": {"equals": "Active"}},
-        )
+        # notion_client is synchronous requests under the hood; run the
+        # query in a thread so it can't stall the event loop
+        response = await asyncio.to_thread(_query_notion_sync)
 
         goals, must, optional = [], [], []
 
@@ -188,18 +245,14 @@ async def get_todo_from_sheets() -> tuple[list[str], list[str], list[str]]:
         return get_todo_from_config()
 
     try:
-        import gspread
+        import gspread  # noqa: F401
     except ImportError:
         logger.error("gspread not installed. Run: pip install gspread")
         return get_todo_from_config()
 
     try:
-        # 使用 service account 认证
-        gc = gspread.service_account(filename=Config.GOOGLE_CREDENTIALS_FILE)
-        sheet = gc.open_by_key(Config.GOOGLE_SHEETS_ID).sheet1
-
-        # 读取三列数据（跳过标题行）
-        all_values = sheet.get_all_values()
+        # 读取三列数据（跳过标题行）；gspread 是同步 API，放到工作线程执行
+        all_values = await asyncio.to_thread(_read_sheet_sync)
 
         if len(all_values) < 2:
             logger.warning("Sheet is empty or has no data rows")
@@ -222,6 +275,14 @@ async def get_todo_from_sheets() -> tuple[list[str], list[str], list[str]]:
         raise
 
 
+# 远程数据源分发表：新增来源只需在这里注册，不用改分支逻辑
+_REMOTE_SOURCES = {
+    "gist": get_todo_from_gist,
+    "notion": get_todo_from_notion,
+    "sheets": get_todo_from_sheets,
+}
+
+
 def parse_markdown_todo(content: str) -> tuple[list[str], list[str], list[str]]:
     """
     解析 Markdown 格式的 TODO 列表
@@ -242,57 +303,38 @@ def parse_markdown_todo(content: str) -> tuple[list[str], list[str], list[str]]:
        * Item 1
        - [ ] Item 2
     """
-    logger.debug(f"Parsing markdown content (first 200 chars): {content[:200]}")
-
-    goals, must, optional = [], [], []
-    current_section = None
-
-    for line in content.split("\n"):
-        line = line.strip()
-        line_lower = line.lower()
-
-        # 检测章节标题（不区分大小写，支持常见拼写变体）
-        # 使用 'in' 而不是 'startswith' 来更灵活地匹配
-        if (line_lower.startswith("##") or line_lower.startswith("#")) and "goal" in line_lower:
-            current_section = "goals"
-            logger.debug(f"Found Goals section: {line}")
-        elif (line_lower.startswith("##") or line_lower.startswith("#")) and "must" in line_lower:
-            current_section = "must"
-            logger.debug(f"Found Must section: {line}")
-        elif (line_lower.startswith("##") or line_lower.startswith("#")) and "opt" in line_lower:
-            # 匹配 "optional", "optinal", "option" 等变体
-            current_section = "optional"
-            logger.debug(f"Found Optional section: {line}")
-        # 检测列表项（支持简单列表和任务列表）
-        elif line.startswith("- ") or line.startswith("* "):
-            # 移除列表标记
-            item = line[2:].strip()
-
-            # 检查是否是任务列表格式并标记完成状态
-            is_completed = False
-            if item.startswith("[ ]"):
-                item = item[3:].strip()
-            elif item.startswith("[x]") or item.startswith("[X]"):
-                item = item[3:].strip()
-                is_completed = True
-
-            if not item:
-                continue
-
-            # 如果已完成，添加特殊标记前缀
-            if is_completed:
-                item = "✓" + item
-
-            match current_section:
-                case "goals":
-                    goals.append(item)
-                    logger.debug(f"  Added to goals: {item}")
-                case "must":
-                    must.append(item)
-                    logger.debug(f"  Added to must: {item}")
-                case "optional":
-                    optional.append(item)
-                    logger.debug(f"  Added to optional: {item}")
-
-    logger.debug(f"Parsed result: {len(goals)} goals, {len(must)} must, {len(optional)} optional")
+    logger.debug("Parsing markdown content (first 200 chars): %s", content[:200])
+
+    # 三个分类桶：按章节名直接索引，省去逐项的 match 分发
+    buckets: dict[str, list[str]] = {"goals": [], "must": [], "optional": []}
+    bucket: list[str] | None = None
+
+    for match in _TODO_LINE_RE.finditer(content):
+        # 检测章节标题（不区分大小写，支持常见拼写变体，
+        # 用 'in' 而不是精确匹配来容忍 "Optinal" 这类笔误）
+        title = match.group("title")
+        if title is not None:
+            title = title.lower()
+            if "goal" in title:
+                bucket = buckets["goals"]
+            elif "must" in title:
+                bucket = buckets["must"]
+            elif "opt" in title:
+                bucket = buckets["optional"]
+            continue
+
+        # 列表项（支持简单列表和任务列表）；章节之外的条目忽略
+        if bucket is None:
+            continue
+
+        item = match.group("item")
+        # 已完成的任务添加特殊标记前缀
+        if match.group("check") in ("x", "X"):
+            item = "✓" + item
+        bucket.append(item)
+
+    goals, must, optional = buckets["goals"], buckets["must"], buckets["optional"]
+    logger.debug(
+        "Parsed result: %d goals, %d must, %d optional", len(goals), len(must), len(optional)
+    )
     return goals, must, optional
@@ -3,6 +3,7 @@
 Coordinates text, shapes, and icon rendering using modular components.
 """
 
+import functools
 import logging
 import os
 
@@ -16,6 +17,16 @@ from .text import TextRenderer
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_truetype(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Open a FreeType face once per (path, size) for the process lifetime.
+
+    ImageFont.truetype re-parses the font file on every call, which adds
+    up when several renderer instances load nine sizes each.
+    """
+    return ImageFont.truetype(font_path, size)
+
+
 class DashboardRenderer:
     """Handles all drawing operations for the dashboard.
 
@@ -55,15 +66,15 @@ class DashboardRenderer:
             font_path = Config.FONT_PATH
 
         try:
-            self.font_xs = ImageFont.truetype(font_path, 18)
-            self.font_s = ImageFont.truetype(font_path, 24)
-            self.font_m = ImageFont.truetype(font_path, 28)
-            self.font_value = ImageFont.truetype(font_path, 32)
-            self.font_date_big = ImageFont.truetype(font_path, 34)
-            self.font_date_small = ImageFont.truetype(font_path, 24)
-            self.font_commits = ImageFont.truetype(font_path, 20)
-            self.font_l = ImageFont.truetype(font_path, 48)
-            self.font_xl = ImageFont.truetype(font_path, 60)
+            self.font_xs = _load_truetype(font_path, 18)
+            self.font_s = _load_truetype(font_path, 24)
+            self.font_m = _load_truetype(font_path, 28)
+            self.font_value = _load_truetype(font_path, 32)
+            self.font_date_big = _load_truetype(font_path, 34)
+            self.font_date_small = _load_truetype(font_path, 24)
+            self.font_commits = _load_truetype(font_path, 20)
+            self.font_l = _load_truetype(font_path, 48)
+            self.font_xl = _load_truetype(font_path, 60)
             logger.debug(f"Loaded fonts from {font_path}")
         except (IOError, OSError) as e:
             logger.warning(f"Failed to load font {font_path}: {e}, using default font")
@@ -107,3 +118,18 @@ class DashboardRenderer:
         self.holiday_icons.draw_full_screen_message(
             draw, width, height, title, message, icon_type, self.font_l, self.font_m
         )
+
+
+_renderer: DashboardRenderer | None = None
+
+
+def get_renderer() -> DashboardRenderer:
+    """Get the shared DashboardRenderer, creating it on first use.
+
+    The renderer is stateless apart from its caches, so layouts can
+    share one instance instead of each re-loading fonts and icons.
+    """
+    global _renderer
+    if _renderer is None:
+        _renderer = DashboardRenderer()
+    return _renderer
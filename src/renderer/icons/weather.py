@@ -11,9 +11,53 @@ from PIL import Image, ImageDraw
 logger = logging.getLogger(__name__)
 
 
+def _cloud_unit_outline(points_per_arc: int = 16) -> tuple[tuple[float, float], ...]:
+    """Tessellate the cloud silhouette into a single polygon outline.
+
+    The silhouette is the union of three radius-10 lobes (left, top,
+    right) plus the flat bridge the old white rectangle provided along
+    the bottom, expressed in units of the scale factor ``s`` relative to
+    the shifted cloud centre. Angles are screen angles (y grows down).
+    """
+    points: list[tuple[float, float]] = []
+
+    def arc(cx: float, cy: float, start_deg: float, end_deg: float) -> None:
+        for i in range(points_per_arc + 1):
+            a = math.radians(start_deg + (end_deg - start_deg) * i / points_per_arc)
+            points.append((cx + 10 * math.cos(a), cy + 10 * math.sin(a)))
+
+    arc(0, -5, 180, 360)  # top lobe, over the crown
+    arc(10, 5, 270, 510)  # right lobe, down to the bridge
+    arc(-10, 5, 30, 270)  # left lobe, bridge back up to the start
+    return tuple(points)
+
+
 class WeatherIcons:
     """Handles weather icon rendering."""
 
+    # The dashboard cycles through a handful of icons at one or two sizes
+    _ICON_CACHE_MAX = 16
+
+    # Unit vectors for the eight sun rays, 45 degrees apart; the trig is
+    # constant so there is no reason to re-run it per render
+    _RAY_DIRS = tuple(
+        (math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 45)
+    )
+
+    # Cloud silhouette as one polygon: a single rasterizer pass instead
+    # of three outlined ellipses plus a masking rectangle, which matters
+    # because rain/snow/thunder all redraw the cloud underneath
+    _CLOUD_OUTLINE = _cloud_unit_outline()
+
+    # Outline pre-multiplied by the scale factor, keyed by rounded s
+    _cloud_scale_cache: dict[float, tuple[tuple[float, float], ...]] = {}
+
+    def __init__(self):
+        # Final 1-bit resized icons keyed by (name, size): loading,
+        # compositing and resizing the PNG repeats identically every
+        # refresh, so later draws collapse to a single paste
+        self._icon_cache: dict[tuple[str, int], Image.Image] = {}
+
     def draw_weather_icon(
         self,
         draw: ImageDraw.ImageDraw,
@@ -35,6 +79,15 @@ class WeatherIcons:
         Returns:
             bool: Whether successfully loaded from file
         """
+        paste_x = int(x - size // 2)
+        paste_y = int(y - size // 2)
+
+        # Served from cache: the icon files are static, so no invalidation
+        icon = self._icon_cache.get((icon_name, size))
+        if icon is not None:
+            draw._image.paste(icon, (paste_x, paste_y))
+            return True
+
         # Try loading from file
         if icons_dir and icons_dir.exists():
             icon_path = icons_dir / f"{icon_name}.png"
@@ -43,24 +96,34 @@ class WeatherIcons:
                 try:
                     icon = Image.open(icon_path)
 
-                    # Handle transparency
-                    if icon.mode == "P":
-                        icon = icon.convert("RGBA")
-                    elif icon.mode == "LA":
-                        icon = icon.convert("RGBA")
-
-                    if icon.mode == "RGBA":
-                        background = Image.new("RGB", icon.size, (255, 255, 255))
-                        background.paste(icon, mask=icon.split()[3])
-                        icon = background
-                    elif icon.mode != "RGB":
-                        icon = icon.convert("RGB")
-
-                    icon = icon.convert("1")
-                    icon = icon.resize((size, size), Image.Resampling.LANCZOS)
+                    if icon.mode in ("1", "L"):
+                        # Already bilevel/grayscale with no alpha: skip the
+                        # RGB composite entirely. Resize in "L" (resampling into
+                        # mode "1" dithers badly), then threshold back to 1-bit
+                        icon = icon.convert("L")
+                        icon = icon.resize((size, size), Image.Resampling.BILINEAR)
+                        icon = icon.point(lambda v: 0 if v < 128 else 255, mode="1")
+                    else:
+                        # Handle transparency
+                        if icon.mode == "P":
+                            icon = icon.convert("RGBA")
+                        elif icon.mode == "LA":
+                            icon = icon.convert("RGBA")
+
+                        if icon.mode == "RGBA":
+                            background = Image.new("RGB", icon.size, (255, 255, 255))
+                            background.paste(icon, mask=icon.split()[3])
+                            icon = background
+                        elif icon.mode != "RGB":
+                            icon = icon.convert("RGB")
+
+                        icon = icon.convert("1")
+                        icon = icon.resize((size, size), Image.Resampling.BILINEAR)
+
+                    if len(self._icon_cache) >= self._ICON_CACHE_MAX:
+                        self._icon_cache.clear()
+                    self._icon_cache[(icon_name, size)] = icon
 
-                    paste_x = int(x - size // 2)
-                    paste_y = int(y - size // 2)
                     draw._image.paste(icon, (paste_x, paste_y))
                     return True
                 except Exception as e:
@@ -84,49 +147,38 @@ class WeatherIcons:
         """Draw sun icon."""
         r = size // 3
         draw.ellipse((x - r, y - r, x + r, y + r), outline=0, width=2)
-        for i in range(0, 360, 45):
-            angle = math.radians(i)
-            ray_start = r + (size * 0.125)
-            ray_end = r + (size * 0.25)
-            x1 = x + math.cos(angle) * ray_start
-            y1 = y + math.sin(angle) * ray_start
-            x2 = x + math.cos(angle) * ray_end
-            y2 = y + math.sin(angle) * ray_end
+        ray_start = r + (size * 0.125)
+        ray_end = r + (size * 0.25)
+        for cos_a, sin_a in self._RAY_DIRS:
+            x1 = x + cos_a * ray_start
+            y1 = y + sin_a * ray_start
+            x2 = x + cos_a * ray_end
+            y2 = y + sin_a * ray_end
             draw.line((x1, y1, x2, y2), fill=0, width=2)
 
     def draw_cloud(self, draw, x, y, size=20):
         """Draw cloud icon."""
         s = size / 40.0
-        y = y + (5 * s)
+        key = round(s, 2)
+        scaled = self._cloud_scale_cache.get(key)
+        if scaled is None:
+            scaled = tuple((px * s, py * s) for px, py in self._CLOUD_OUTLINE)
+            self._cloud_scale_cache[key] = scaled
 
-        draw.ellipse(
-            (x - 20 * s, y - 5 * s, x, y + 15 * s), fill=255, outline=0, width=max(1, int(2 * s))
-        )
-        draw.ellipse(
-            (x, y - 5 * s, x + 20 * s, y + 15 * s), fill=255, outline=0, width=max(1, int(2 * s))
-        )
-        draw.ellipse(
-            (x - 10 * s, y - 15 * s, x + 10 * s, y + 5 * s),
-            fill=255,
-            outline=0,
-            width=max(1, int(2 * s)),
-        )
-        draw.rectangle((x - 10 * s, y, x + 10 * s, y + 10 * s), fill=255)
+        cy = y + (5 * s)
+        draw.polygon([(x + px, cy + py) for px, py in scaled], fill=255, outline=0)
 
     def draw_rain(self, draw, x, y, size=20):
         """Draw rain icon."""
         self.draw_cloud(draw, x, y, size)
         s = size / 40.0
-        y_base = y + (15 * s)
-        line_len = 10 * s
+        y_top = y + (20 * s)
+        y_bottom = y_top + 10 * s
         offset = 8 * s
+        width = max(1, int(2 * s))
 
-        for dx in [-offset, 0, offset]:
-            draw.line(
-                (x + dx, y_base + 5 * s, x + dx, y_base + 5 * s + line_len),
-                fill=0,
-                width=max(1, int(2 * s)),
-            )
+        for dx in (-offset, 0, offset):
+            draw.line((x + dx, y_top, x + dx, y_bottom), fill=0, width=width)
 
     def draw_snow(self, draw, x, y, size=20):
         """Draw snow icon."""
@@ -134,12 +186,10 @@ class WeatherIcons:
         s = size / 40.0
         y_base = y + (15 * s)
         r_snow = 2 * s
+        d_snow = r_snow * 2
 
-        positions = [(-12 * s, 5 * s), (-2 * s, 8 * s), (8 * s, 5 * s)]
-        for dx, dy in positions:
-            draw.ellipse(
-                (x + dx, y_base + dy, x + dx + r_snow * 2, y_base + dy + r_snow * 2), fill=0
-            )
+        for dx, dy in ((-12 * s, 5 * s), (-2 * s, 8 * s), (8 * s, 5 * s)):
+            draw.ellipse((x + dx, y_base + dy, x + dx + d_snow, y_base + dy + d_snow), fill=0)
 
     def draw_thunder(self, draw, x, y, size=20):
         """Draw thunder icon."""
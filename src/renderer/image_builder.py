@@ -9,9 +9,6 @@ from PIL import Image, ImageDraw
 
 from src.config import Config
 from src.layouts import DashboardLayout
-from src.layouts.poetry import PoetryLayout
-from src.layouts.quote import QuoteLayout
-from src.providers.wallpaper import WallpaperManager
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +36,17 @@ class ImageBuilder:
         self.width = width
         self.height = height
 
+        # Mode-name -> builder table; every builder takes (data, layout)
+        # so dispatch is a single dict lookup
+        self._dispatch = {
+            "dashboard": self._build_dashboard,
+            "quote": self._build_quote,
+            "poetry": self._build_poetry,
+            "wallpaper": self._build_wallpaper,
+            "holiday": self._build_holiday,
+            "year_end": self._build_year_end,
+        }
+
     def build(self, mode: str, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build image for a display mode.
 
@@ -52,38 +60,36 @@ class ImageBuilder:
         """
         logger.debug(f"Building image for mode: {mode}")
 
-        if mode == "dashboard":
-            return self._build_dashboard(data, layout)
-        elif mode == "quote":
-            return self._build_quote(data)
-        elif mode == "poetry":
-            return self._build_poetry(data)
-        elif mode == "wallpaper":
-            return self._build_wallpaper(data)
-        elif mode == "holiday":
-            return self._build_holiday(data, layout)
-        elif mode == "year_end":
-            return self._build_year_end(data, layout)
-        else:
+        builder = self._dispatch.get(mode)
+        if builder is None:
             logger.warning(f"Unknown mode '{mode}', using dashboard")
-            return self._build_dashboard(data, layout)
+            builder = self._build_dashboard
+        return builder(data, layout)
 
     def _build_dashboard(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build dashboard image."""
         return layout.create_image(self.width, self.height, data)
 
-    def _build_quote(self, data: dict) -> Image.Image:
+    def _build_quote(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build quote image."""
+        # Imported lazily: most deployments only ever build the
+        # dashboard mode, so keep alternate layouts off the startup path
+        from src.layouts.quote import QuoteLayout
+
         quote_layout = QuoteLayout()
         return quote_layout.create_quote_image(self.width, self.height, data["quote"])
 
-    def _build_poetry(self, data: dict) -> Image.Image:
+    def _build_poetry(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build poetry image."""
+        from src.layouts.poetry import PoetryLayout
+
         poetry_layout = PoetryLayout()
         return poetry_layout.create_poetry_image(self.width, self.height, data["poetry"])
 
-    def _build_wallpaper(self, data: dict) -> Image.Image:
+    def _build_wallpaper(self, data: dict, layout: DashboardLayout) -> Image.Image:
         """Build wallpaper image."""
+        from src.providers.wallpaper import WallpaperManager
+
         wallpaper_manager = WallpaperManager()
         wallpaper_name = Config.display.wallpaper_name or None
         return wallpaper_manager.create_wallpaper(self.width, self.height, wallpaper_name)
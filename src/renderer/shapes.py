@@ -3,7 +3,7 @@
 Provides functions for drawing progress rings and other shapes.
 """
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 
 class ShapeRenderer:
@@ -15,6 +15,17 @@ class ShapeRenderer:
     COLOR_LIGHT_GRAY = 192
     COLOR_WHITE = 255
 
+    # Rings come in one or two geometries and 21 distinct 5% steps
+    _RING_CACHE_MAX = 64
+
+    def __init__(self):
+        # Pre-rendered ring tiles keyed by (radius, thickness, grayscale,
+        # percent rounded to 5%): the ellipse + pieslice + ellipse passes
+        # repeat identically every refresh, so later draws collapse to a
+        # single masked paste. The circular mask keeps the tile's corner
+        # pixels from clobbering whatever surrounds the ring
+        self._ring_cache: dict[tuple[int, int, bool, int], tuple[Image.Image, Image.Image]] = {}
+
     def draw_progress_ring(
         self,
         draw: ImageDraw.ImageDraw,
@@ -25,24 +36,54 @@ class ShapeRenderer:
         thickness: int = 5,
         use_grayscale: bool = False,
     ):
-        """Draw a progress ring with optional grayscale support."""
-        ring_color = self.COLOR_DARK_GRAY if use_grayscale else 0
-        bg_color = self.COLOR_WHITE
+        """Draw a progress ring with optional grayscale support.
 
-        bbox = (x - radius, y - radius, x + radius, y + radius)
-        draw.ellipse(bbox, outline=ring_color, width=1)
-
-        start_angle = -90
+        The percentage is rounded to the nearest 5% so successive
+        refreshes reuse the same cached tile.
+        """
         try:
             p = float(percent)
         except ValueError:
             p = 0
 
-        end_angle = -90 + (360 * (p / 100.0))
-        if p > 0:
-            draw.pieslice(bbox, start=start_angle, end=end_angle, fill=ring_color)
+        p5 = int(round(p / 5.0)) * 5
+        key = (radius, thickness, use_grayscale, p5)
+        cached = self._ring_cache.get(key)
+        if cached is None:
+            cached = self._render_ring(radius, thickness, p5, use_grayscale)
+            if len(self._ring_cache) >= self._RING_CACHE_MAX:
+                self._ring_cache.clear()
+            self._ring_cache[key] = cached
+
+        tile, mask = cached
+        draw._image.paste(tile, (x - radius, y - radius), mask)
+
+    def _render_ring(
+        self, radius: int, thickness: int, percent: float, use_grayscale: bool
+    ) -> tuple[Image.Image, Image.Image]:
+        """Rasterize one ring tile plus its circular paste mask."""
+        ring_color = self.COLOR_DARK_GRAY if use_grayscale else 0
+        bg_color = self.COLOR_WHITE
+
+        side = radius * 2 + 1
+        bbox = (0, 0, radius * 2, radius * 2)
+
+        tile = Image.new("L", (side, side), bg_color)
+        tile_draw = ImageDraw.Draw(tile)
+        tile_draw.ellipse(bbox, outline=ring_color, width=1)
+
+        if percent > 0:
+            end_angle = -90 + (360 * (percent / 100.0))
+            tile_draw.pieslice(bbox, start=-90, end=end_angle, fill=ring_color)
 
         inner_r = radius - thickness
-        draw.ellipse(
-            (x - inner_r, y - inner_r, x + inner_r, y + inner_r), fill=bg_color, outline=ring_color
+        tile_draw.ellipse(
+            (radius - inner_r, radius - inner_r, radius + inner_r, radius + inner_r),
+            fill=bg_color,
+            outline=ring_color,
         )
+
+        mask = Image.new("1", (side, side), 0)
+        ImageDraw.Draw(mask).ellipse(bbox, fill=255)
+
+        return tile, mask
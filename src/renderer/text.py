@@ -5,6 +5,12 @@ Provides text drawing functions with various alignment and truncation options.
 
 from PIL import ImageDraw, ImageFont
 
+# Measured (width, height) per (font, text): centering otherwise runs
+# FreeType shaping twice per string (once to measure, once to draw),
+# and labels like "Weekly" / weekday names repeat every refresh
+_MEASURE_CACHE: dict[tuple[ImageFont.FreeTypeFont, str], tuple[int, int]] = {}
+_MEASURE_CACHE_MAX = 1024
+
 
 class TextRenderer:
     """Handles text rendering operations."""
@@ -33,12 +39,20 @@ class TextRenderer:
         align_y_center: bool = True,
     ):
         """Draw centered text at specified coordinates."""
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
-        except AttributeError:
-            w, h = draw.textsize(text, font=font)
+        key = (font, text)
+        size = _MEASURE_CACHE.get(key)
+        if size is None:
+            try:
+                bbox = draw.textbbox((0, 0), text, font=font)
+                w = bbox[2] - bbox[0]
+                h = bbox[3] - bbox[1]
+            except AttributeError:
+                w, h = draw.textsize(text, font=font)
+            if len(_MEASURE_CACHE) >= _MEASURE_CACHE_MAX:
+                _MEASURE_CACHE.clear()
+            _MEASURE_CACHE[key] = (w, h)
+        else:
+            w, h = size
 
         y_offset = (h // 2 + 3) if align_y_center else 0
         draw.text((x - w // 2, y - y_offset), text, font=font, fill=fill)
@@ -5,25 +5,60 @@ This module contains the background task for rotating through HackerNews pages.
 
 import asyncio
 import logging
+from typing import NamedTuple
 
 from PIL import Image, ImageDraw
 
 from src.config import Config
+from src.core import time_utils
+from src.core.display_lock import display_lock
 from src.layouts import DashboardLayout
 from src.providers import Dashboard
 
+# Module import rather than name import so tests (and hot reload) that
+# patch the provider attribute are still seen at call time
+from src.providers import hackernews as hackernews_provider
+
 logger = logging.getLogger(__name__)
 
-# HackerNews region coordinates (for partial refresh)
-HN_REGION = {
-    "x": 0,
-    "y": 115,  # LIST_HEADER_Y
-    "w": 800,  # Full width
-    "h": 250,  # From LIST_HEADER_Y to LINE_BOTTOM_Y
-}
 
-# Global lock to prevent concurrent display refreshes
-_refresh_lock = asyncio.Lock()
+class _HNRegion(NamedTuple):
+    """HackerNews region coordinates (for partial refresh)."""
+
+    x: int
+    y: int
+    w: int
+    h: int
+    x_end: int
+    y_end: int
+
+
+# y spans LIST_HEADER_Y to LINE_BOTTOM_Y at full panel width
+HN_REGION = _HNRegion(x=0, y=115, w=800, h=250, x_end=800, y_end=365)
+
+
+def _do_partial_refresh(epd, full_img) -> None:
+    """Pack the frame and push it over SPI (blocking; run in a thread)."""
+    # Need to call init_part before partial refresh
+    if hasattr(epd, "init_part"):
+        epd.init_part()
+
+    # Log the refresh region for debugging
+    logger.debug(
+        f"Partial refresh region: x={HN_REGION.x}, y={HN_REGION.y}, "
+        f"x_end={HN_REGION.x_end}, y_end={HN_REGION.y_end}"
+    )
+
+    if hasattr(epd, "display_partial_region"):
+        # Packs only the HN rows instead of scanning the full frame
+        epd.display_partial_region(
+            full_img, HN_REGION.x, HN_REGION.y, HN_REGION.x_end, HN_REGION.y_end
+        )
+    else:
+        buffer = epd.getbuffer(full_img)
+        epd.display_partial_buffer(
+            buffer, HN_REGION.x, HN_REGION.y, HN_REGION.x_end, HN_REGION.y_end
+        )
 
 
 async def hackernews_pagination_task(
@@ -37,9 +72,33 @@ async def hackernews_pagination_task(
         layout: DashboardLayout instance
         dm: Dashboard data manager
     """
+    # Pre-scheduled fetch for the upcoming tick: the network round trip
+    # runs during the page-display window instead of adding to the
+    # refresh latency
+    next_page_task: asyncio.Task | None = None
+
+    # Story IDs shown by the previous tick; partial refreshes wear the
+    # panel, so identical pages (e.g. total_pages == 1) are not redrawn
+    prev_story_ids: tuple[int, ...] | None = None
+
     try:
         logger.info("🔄 Starting HackerNews pagination task")
 
+        # Full-frame canvas reused across ticks (EPD requires a full
+        # image for partial refresh; it usually must be 1-bit B/W).
+        # The header/footer areas stay untouched between ticks, so each
+        # rotation only needs to repaint the HN rectangle
+        full_img = Image.new("1", (epd.width, epd.height), 255)
+        full_draw = ImageDraw.Draw(full_img)
+
+        # Quiet-hours window is fixed config at runtime; build the
+        # checker once instead of re-parsing the timezone every tick
+        quiet = time_utils.QuietHours(
+            Config.hardware.quiet_start_hour,
+            Config.hardware.quiet_end_hour,
+            Config.hardware.timezone,
+        )
+
         while not stop_event.is_set():
             # Wait for page duration or stop signal
             try:
@@ -53,62 +112,61 @@ async def hackernews_pagination_task(
                 pass
 
             # Check if in quiet hours before refreshing
-            from src.core.time_utils import QuietHours
-
-            quiet = QuietHours(
-                Config.hardware.quiet_start_hour,
-                Config.hardware.quiet_end_hour,
-                Config.hardware.timezone,
-            )
             is_quiet, _ = quiet.check()
             if is_quiet:
                 logger.debug("⏸️  Skipping HN partial refresh (quiet hours)")
                 continue
 
-            # Fetch next page
-            from src.providers.hackernews import get_hackernews
-
-            hn_data = await get_hackernews(dm.client, advance_page=True)
+            # Fetch next page (use the pre-scheduled fetch if one is
+            # already in flight from the previous tick)
+            if next_page_task is None:
+                next_page_task = asyncio.create_task(
+                    hackernews_provider.get_hackernews(dm.client, advance_page=True)
+                )
+            hn_data = await next_page_task
+            next_page_task = None
             logger.info(
                 f"📰 HN Page {hn_data.get('page', 1)}/{hn_data.get('total_pages', 1)} "
                 f"({hn_data.get('start_idx', 1)}~{hn_data.get('end_idx', 0)})"
             )
 
+            # Skip the draw + refresh entirely if the page content is
+            # identical to what is already on the panel
+            story_ids = tuple(s.id for s in hn_data.get("stories", ()))
+            if story_ids == prev_story_ids:
+                logger.debug("HN page unchanged, skipping refresh")
+                continue
+            prev_story_ids = story_ids
+
             # Update layout data
             layout._current_hackernews = hn_data
 
-            # Acquire lock to prevent concurrent refreshes
-            async with _refresh_lock:
-                # Create FULL-SIZE image (EPD requires full image for partial refresh)
-                # Partial refresh usually requires 1-bit B/W image
-                image_mode = "1"
-                full_img = Image.new(image_mode, (epd.width, epd.height), 255)
-                full_draw = ImageDraw.Draw(full_img)
+            # Kick off the following page's fetch now, so its network
+            # latency overlaps the render and EPD refresh below
+            if not stop_event.is_set():
+                next_page_task = asyncio.create_task(
+                    hackernews_provider.get_hackernews(dm.client, advance_page=True)
+                )
+
+            # Take the shared EPD lock so this partial refresh cannot
+            # overlap a full refresh from the main loop
+            async with display_lock:
+                # Wipe only the HN rectangle; the rest of the frame is
+                # unchanged since the last tick
+                full_draw.rectangle(
+                    (HN_REGION.x, HN_REGION.y, HN_REGION.x_end, HN_REGION.y_end), fill=255
+                )
 
                 # Draw HN section at the correct position
                 layout._draw_hackernews(full_draw, epd.width)
 
-                # Partial refresh - EPD will only update the specified region
+                # Partial refresh - EPD will only update the specified region.
+                # getbuffer packs the raster and display_partial_buffer does
+                # blocking SPI I/O, so run both off the event loop; the
+                # shared lock stays held across the await, so no other
+                # EPD access can run while the thread drives the bus
                 try:
-                    # Need to call init_part before partial refresh
-                    if hasattr(epd, "init_part"):
-                        epd.init_part()
-
-                    buffer = epd.getbuffer(full_img)
-
-                    # Log the refresh region for debugging
-                    logger.debug(
-                        f"Partial refresh region: x={HN_REGION['x']}, y={HN_REGION['y']}, "
-                        f"x_end={HN_REGION['x'] + HN_REGION['w']}, y_end={HN_REGION['y'] + HN_REGION['h']}"
-                    )
-
-                    epd.display_partial_buffer(
-                        buffer,
-                        HN_REGION["x"],
-                        HN_REGION["y"],
-                        HN_REGION["x"] + HN_REGION["w"],
-                        HN_REGION["y"] + HN_REGION["h"],
-                    )
+                    await asyncio.to_thread(_do_partial_refresh, epd, full_img)
                     logger.debug("✅ HN partial refresh complete")
                 except Exception as e:
                     logger.error(f"Failed to perform partial refresh: {e}")
@@ -119,4 +177,6 @@ async def hackernews_pagination_task(
     except Exception as e:
         logger.error(f"Error in HackerNews pagination task: {e}")
     finally:
+        if next_page_task is not None and not next_page_task.done():
+            next_page_task.cancel()
         logger.info("👋 HackerNews pagination task stopped")
@@ -4,7 +4,8 @@ This module contains TypedDict definitions and type aliases for improved type sa
 and better IDE support throughout the application.
 """
 
-from typing import TypedDict
+from collections.abc import Sequence
+from typing import NamedTuple, TypedDict
 
 
 class WeatherData(TypedDict):
@@ -31,8 +32,13 @@ class BTCData(TypedDict):
     usd_24h_change: float  # 24-hour price change percentage
 
 
-class HackerNewsStory(TypedDict):
-    """Individual Hacker News story."""
+class HackerNewsStory(NamedTuple):
+    """Individual Hacker News story.
+
+    A NamedTuple rather than a TypedDict: the story list is rebuilt and
+    iterated every rotation tick, and the tuple layout avoids a dict
+    allocation plus per-field hashing for each story.
+    """
 
     id: int  # Story ID
     title: str  # Story title
@@ -42,7 +48,7 @@ class HackerNewsStory(TypedDict):
 class HackerNewsData(TypedDict):
     """Paginated Hacker News data."""
 
-    stories: list[HackerNewsStory]  # Stories for current page
+    stories: Sequence[HackerNewsStory]  # Stories for current page (immutable view)
     page: int  # Current page number (1-indexed)
     total_pages: int  # Total number of pages
     start_idx: int  # Starting index (1-indexed)
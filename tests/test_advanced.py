@@ -112,3 +112,11 @@ class TestTimeSlots:
         slots = TimeSlots("invalid")
         assert not slots
         assert not slots.contains_hour(10)
+
+    def test_malformed_slots_rejected_entirely(self):
+        """Test that partially numeric garbage does not mis-parse."""
+        # "9:00-12:00" must not become slot 0-12, "100-200" not 0-20
+        for value in ("9:00-12:00", "100-200", "0-12,junk"):
+            slots = TimeSlots(value)
+            assert not slots
+            assert not slots.contains_hour(10)
@@ -65,38 +65,90 @@ class TestStateManager:
         result = await sm2.get("persistent_key")
         assert result == "persistent_value"
 
+    @pytest.mark.asyncio
+    async def test_coalescing_set_defers_write(self, temp_dir):
+        """Test that set in coalescing mode marks dirty without writing."""
+        sm = StateManager(temp_dir, flush_interval=60)
+        await sm.set("deferred_key", "value")
+
+        # Value is served from cache, but nothing hit the disk yet
+        assert sm.get_sync("deferred_key") == "value"
+        assert "deferred_key" in sm._dirty
+        assert not (temp_dir / "deferred_key.json").exists()
+
+        # Cancel the scheduled flush so it doesn't leak past the test
+        sm._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_flush_persists(self, temp_dir):
+        """Test that flush writes dirty keys and clears them."""
+        sm = StateManager(temp_dir, flush_interval=60)
+        await sm.set("flushed_key", {"value": 1})
+        await sm.flush()
+
+        assert sm._dirty == set()
+        assert (temp_dir / "flushed_key.json").exists()
+
+        # A fresh instance sees the flushed value on disk
+        sm2 = StateManager(temp_dir)
+        assert await sm2.get("flushed_key") == {"value": 1}
+
+        sm._flush_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_failed_flush_keeps_key_dirty(self, temp_dir, monkeypatch):
+        """Test that a failed persist leaves the key dirty for retry."""
+        sm = StateManager(temp_dir, flush_interval=60)
+        await sm.set("retry_key", "value")
+
+        async def failing_persist(key, value):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(sm, "_persist", failing_persist)
+        await sm.flush()
+
+        # Failure is logged, not raised, and the key stays dirty
+        assert "retry_key" in sm._dirty
+        assert not (temp_dir / "retry_key.json").exists()
+
+        # Once persisting works again, the next flush retries it
+        monkeypatch.undo()
+        await sm.flush()
+        assert "retry_key" not in sm._dirty
+        assert (temp_dir / "retry_key.json").exists()
+
+        sm._flush_task.cancel()
+
 
 class TestTTLCache:
     """Tests for TTLCache class."""
 
-    @pytest.mark.asyncio
-    async def test_set_and_get(self):
+    def test_set_and_get(self):
         """Test basic cache operations."""
         cache = TTLCache(maxsize=10, ttl=60)
-        await cache.set("key1", "value1")
-        result = await cache.get("key1")
+        cache.set("key1", "value1")
+        result = cache.get("key1")
         assert result == "value1"
 
     @pytest.mark.asyncio
     async def test_expiration(self):
         """Test TTL expiration."""
         cache = TTLCache(maxsize=10, ttl=0)  # Immediate expiration
-        await cache.set("key1", "value1")
+        cache.set("key1", "value1")
         await asyncio.sleep(0.1)  # Wait for expiration
-        result = await cache.get("key1")
+        result = cache.get("key1")
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_lru_eviction(self):
+    def test_lru_eviction(self):
         """Test LRU eviction when cache is full."""
         cache = TTLCache(maxsize=2, ttl=60)
-        await cache.set("key1", "value1")
-        await cache.set("key2", "value2")
-        await cache.set("key3", "value3")  # Should evict key1
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key3", "value3")  # Should evict key1
 
-        result1 = await cache.get("key1")
-        result2 = await cache.get("key2")
-        result3 = await cache.get("key3")
+        result1 = cache.get("key1")
+        result2 = cache.get("key2")
+        result3 = cache.get("key3")
 
         assert result1 is None  # Evicted
         assert result2 == "value2"
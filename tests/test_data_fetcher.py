@@ -36,7 +36,7 @@ class TestDataFetcher:
     @pytest.mark.asyncio
     async def test_fetch_quote(self, fetcher):
         """Test fetching quote data."""
-        with patch("src.providers.quote.get_quote", new_callable=AsyncMock) as mock_get_quote:
+        with patch("src.core.data_fetcher.get_quote", new_callable=AsyncMock) as mock_get_quote:
             mock_get_quote.return_value = "Test Quote"
 
             data = await fetcher.fetch("quote")
@@ -47,7 +47,7 @@ class TestDataFetcher:
     @pytest.mark.asyncio
     async def test_fetch_poetry(self, fetcher):
         """Test fetching poetry data."""
-        with patch("src.providers.poetry.get_poetry", new_callable=AsyncMock) as mock_get_poetry:
+        with patch("src.core.data_fetcher.get_poetry", new_callable=AsyncMock) as mock_get_poetry:
             mock_get_poetry.return_value = "Test Poetry"
 
             data = await fetcher.fetch("poetry")
@@ -64,14 +64,13 @@ class TestDataFetcher:
     @pytest.mark.asyncio
     async def test_fetch_holiday(self, fetcher):
         """Test fetching holiday data."""
-        with patch("src.layouts.holiday.HolidayManager") as MockHolidayManager:
-            mock_manager = MockHolidayManager.return_value
-            mock_manager.get_holiday.return_value = "Christmas"
-
+        with patch.object(
+            fetcher._holiday_manager, "get_holiday", return_value="Christmas"
+        ) as mock_get_holiday:
             data = await fetcher.fetch("holiday")
 
             assert data == {"holiday": "Christmas"}
-            mock_manager.get_holiday.assert_called_once()
+            mock_get_holiday.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_fetch_year_end(self, fetcher, mock_dashboard):
@@ -60,3 +60,25 @@ class TestDisplayController:
         mode = controller.get_current_mode(now)
         # Mode should be one of the valid modes
         assert mode in ["dashboard", "quote", "poetry", "wallpaper", "holiday"]
+
+    def test_intervals_rebuilt_on_config_reload(self):
+        """Test that a config reload callback refreshes the interval map."""
+        from src.config import _reload_callbacks, unregister_reload_callback
+
+        controller = DisplayController()
+        try:
+            # Constructor registers the rebuild hook with the watcher
+            assert controller._rebuild_intervals in _reload_callbacks
+
+            # Simulate a reload that changed the dashboard interval
+            old_display = controller.config.display
+            controller.config.display = old_display.model_copy(
+                update={"refresh_interval_dashboard": 1234}
+            )
+            try:
+                controller._rebuild_intervals()
+                assert controller.get_refresh_interval("dashboard") == 1234
+            finally:
+                controller.config.display = old_display
+        finally:
+            unregister_reload_callback(controller._rebuild_intervals)
@@ -1,5 +1,6 @@
 """Tests for HackerNews provider."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -12,6 +13,13 @@ from src.providers.hackernews import (
 )
 
 
+def _json_response(payload) -> MagicMock:
+    """Build a mock response whose body is the JSON-encoded payload."""
+    response = MagicMock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
 class TestFetchStory:
     """Tests for _fetch_story function."""
 
@@ -19,14 +27,15 @@ class TestFetchStory:
     async def test_fetch_story_success(self):
         """Test successful story fetch."""
         mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "id": 123,
-            "title": "Test Story",
-            "url": "https://example.com",
-            "score": 100,
-            "by": "testuser",
-        }
+        mock_response = _json_response(
+            {
+                "id": 123,
+                "title": "Test Story",
+                "url": "https://example.com",
+                "score": 100,
+                "by": "testuser",
+            }
+        )
         mock_client.get.return_value = mock_response
 
         story = await _fetch_story(mock_client, 123)
@@ -52,7 +61,7 @@ class TestFetchStory:
         """Test story fetch with invalid JSON."""
         mock_client = AsyncMock(spec=httpx.AsyncClient)
         mock_response = MagicMock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
         mock_client.get.return_value = mock_response
 
         story = await _fetch_story(mock_client, 123)
@@ -63,12 +72,13 @@ class TestFetchStory:
     async def test_fetch_story_missing_fields(self):
         """Test story with missing optional fields."""
         mock_client = AsyncMock(spec=httpx.AsyncClient)
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "id": 123,
-            "title": "Test Story",
-            # Missing url, score, by
-        }
+        mock_response = _json_response(
+            {
+                "id": 123,
+                "title": "Test Story",
+                # Missing url, score, by
+            }
+        )
         mock_client.get.return_value = mock_response
 
         story = await _fetch_story(mock_client, 123)
@@ -87,29 +97,29 @@ class TestFetchAllStories:
         mock_client = AsyncMock(spec=httpx.AsyncClient)
 
         # Mock top stories response
-        top_stories_response = MagicMock()
-        top_stories_response.json.return_value = [1, 2, 3, 4, 5]
+        top_stories_response = _json_response([1, 2, 3, 4, 5])
 
         # Mock individual story responses
-        story_responses = []
-        for i in range(1, 6):
-            response = MagicMock()
-            response.json.return_value = {
-                "id": i,
-                "title": f"Story {i}",
-                "url": f"https://example.com/{i}",
-                "score": i * 10,
-                "by": f"user{i}",
-            }
-            story_responses.append(response)
+        story_responses = [
+            _json_response(
+                {
+                    "id": i,
+                    "title": f"Story {i}",
+                    "url": f"https://example.com/{i}",
+                    "score": i * 10,
+                    "by": f"user{i}",
+                }
+            )
+            for i in range(1, 6)
+        ]
 
         mock_client.get.side_effect = [top_stories_response] + story_responses
 
         stories = await _fetch_all_stories(mock_client)
 
         assert len(stories) == 5
-        assert stories[0]["title"] == "Story 1"
-        assert stories[4]["title"] == "Story 5"
+        assert stories[0].title == "Story 1"
+        assert stories[4].title == "Story 5"
 
     @pytest.mark.asyncio
     async def test_fetch_all_stories_with_failures(self):
@@ -117,15 +127,11 @@ class TestFetchAllStories:
         mock_client = AsyncMock(spec=httpx.AsyncClient)
 
         # Mock top stories
-        top_stories_response = MagicMock()
-        top_stories_response.json.return_value = [1, 2, 3]
+        top_stories_response = _json_response([1, 2, 3])
 
         # First story succeeds, second fails, third succeeds
-        story1 = MagicMock()
-        story1.json.return_value = {"id": 1, "title": "Story 1"}
-
-        story3 = MagicMock()
-        story3.json.return_value = {"id": 3, "title": "Story 3"}
+        story1 = _json_response({"id": 1, "title": "Story 1"})
+        story3 = _json_response({"id": 3, "title": "Story 3"})
 
         mock_client.get.side_effect = [
             top_stories_response,
@@ -138,19 +144,17 @@ class TestFetchAllStories:
 
         # Should return only successful stories
         assert len(stories) == 2
-        assert stories[0]["id"] == 1
-        assert stories[1]["id"] == 3
+        assert stories[0].id == 1
+        assert stories[1].id == 3
 
     @pytest.mark.asyncio
     async def test_fetch_all_stories_cache(self):
         """Test that stories are cached."""
         mock_client = AsyncMock(spec=httpx.AsyncClient)
 
-        top_stories_response = MagicMock()
-        top_stories_response.json.return_value = [1, 2]
+        top_stories_response = _json_response([1, 2])
 
-        story_response = MagicMock()
-        story_response.json.return_value = {"id": 1, "title": "Story 1"}
+        story_response = _json_response({"id": 1, "title": "Story 1"})
 
         mock_client.get.side_effect = [top_stories_response, story_response, story_response]
 
@@ -57,14 +57,14 @@ class TestWeatherIcons:
     def test_draw_cloud(self, icons, mock_draw):
         """Test drawing cloud icon."""
         icons.draw_cloud(mock_draw, 100, 100, 30)
-        assert mock_draw.ellipse.call_count >= 3
-        assert mock_draw.rectangle.called
+        # Cloud silhouette is rendered as a single polygon pass
+        mock_draw.polygon.assert_called_once()
 
     def test_draw_rain(self, icons, mock_draw):
         """Test drawing rain icon."""
         icons.draw_rain(mock_draw, 100, 100, 30)
         # Should draw cloud + rain lines
-        assert mock_draw.ellipse.called
+        assert mock_draw.polygon.called
         assert mock_draw.line.called
 
     def test_draw_snow(self, icons, mock_draw):
@@ -77,7 +77,7 @@ class TestWeatherIcons:
         """Test drawing thunder icon."""
         icons.draw_thunder(mock_draw, 100, 100, 30)
         # Should draw cloud + lightning lines
-        assert mock_draw.ellipse.called
+        assert mock_draw.polygon.called
         assert mock_draw.line.called
 
     def test_draw_unknown_icon(self, icons, mock_draw):
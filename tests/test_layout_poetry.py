@@ -14,7 +14,7 @@ class TestPoetryLayout:
     @pytest.fixture
     def layout(self):
         """Create a PoetryLayout instance."""
-        with patch("src.layouts.poetry.DashboardRenderer"):
+        with patch("src.layouts.poetry.get_renderer"):
             return PoetryLayout()
 
     def test_init(self, layout):
@@ -17,50 +17,52 @@ class TestMeasureTime:
     async def test_measure_time_async(self):
         """Test measure_time decorator with async function."""
 
-        @measure_time
-        async def async_function():
-            await asyncio.sleep(0.01)
-            return "result"
-
         with patch("src.core.performance.logger") as mock_logger:
+            # Decorate under the mock so the decoration-time level check passes
+            @measure_time
+            async def async_function():
+                await asyncio.sleep(0.01)
+                return "result"
+
             result = await async_function()
 
             assert result == "result"
             # Should log execution time
             mock_logger.info.assert_called_once()
-            log_message = mock_logger.info.call_args[0][0]
-            assert "async_function" in log_message
-            assert "took" in log_message
-            assert "s" in log_message
+            log_format, *log_args = mock_logger.info.call_args[0]
+            assert "took" in log_format
+            assert "async_function" in log_args
 
     def test_measure_time_sync(self):
         """Test measure_time decorator with sync function."""
 
-        @measure_time
-        def sync_function():
-            time.sleep(0.01)
-            return "result"
-
         with patch("src.core.performance.logger") as mock_logger:
+
+            @measure_time
+            def sync_function():
+                time.sleep(0.01)
+                return "result"
+
             result = sync_function()
 
             assert result == "result"
             # Should log execution time
             mock_logger.info.assert_called_once()
-            log_message = mock_logger.info.call_args[0][0]
-            assert "sync_function" in log_message
-            assert "took" in log_message
+            log_format, *log_args = mock_logger.info.call_args[0]
+            assert "took" in log_format
+            assert "sync_function" in log_args
 
     @pytest.mark.asyncio
     async def test_measure_time_async_with_exception(self):
         """Test measure_time decorator handles exceptions in async functions."""
 
-        @measure_time
-        async def failing_function():
-            await asyncio.sleep(0.01)
-            raise ValueError("Test error")
-
         with patch("src.core.performance.logger") as mock_logger:
+
+            @measure_time
+            async def failing_function():
+                await asyncio.sleep(0.01)
+                raise ValueError("Test error")
+
             with pytest.raises(ValueError, match="Test error"):
                 await failing_function()
 
@@ -70,12 +72,13 @@ class TestMeasureTime:
     def test_measure_time_sync_with_exception(self):
         """Test measure_time decorator handles exceptions in sync functions."""
 
-        @measure_time
-        def failing_function():
-            time.sleep(0.01)
-            raise ValueError("Test error")
-
         with patch("src.core.performance.logger") as mock_logger:
+
+            @measure_time
+            def failing_function():
+                time.sleep(0.01)
+                raise ValueError("Test error")
+
             with pytest.raises(ValueError, match="Test error"):
                 failing_function()
 
@@ -86,26 +89,40 @@ class TestMeasureTime:
     async def test_measure_time_async_with_args(self):
         """Test measure_time decorator with function arguments."""
 
-        @measure_time
-        async def function_with_args(a, b, c=None):
-            await asyncio.sleep(0.01)
-            return a + b + (c or 0)
-
         with patch("src.core.performance.logger"):
+
+            @measure_time
+            async def function_with_args(a, b, c=None):
+                await asyncio.sleep(0.01)
+                return a + b + (c or 0)
+
             result = await function_with_args(1, 2, c=3)
             assert result == 6
 
     def test_measure_time_sync_with_args(self):
         """Test measure_time decorator with sync function arguments."""
 
-        @measure_time
-        def function_with_args(a, b, c=None):
-            return a + b + (c or 0)
-
         with patch("src.core.performance.logger"):
+
+            @measure_time
+            def function_with_args(a, b, c=None):
+                return a + b + (c or 0)
+
             result = function_with_args(1, 2, c=3)
             assert result == 6
 
+    def test_measure_time_noop_when_info_disabled(self):
+        """Test that decoration is a no-op when INFO logging is disabled."""
+
+        def plain_function():
+            return "result"
+
+        with patch("src.core.performance.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            decorated = measure_time(plain_function)
+
+        assert decorated is plain_function
+
 
 class TestLogSlowOperations:
     """Tests for log_slow_operations decorator."""
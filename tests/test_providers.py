@@ -180,3 +180,30 @@ class TestGitHubProvider:
             from src import config
 
             config.Config.model_rebuild()
+
+
+class TestDashboardCache:
+    """Tests for Dashboard cache serialization."""
+
+    def test_save_cache_converts_story_tuples(self, tmp_path):
+        """Test that HackerNewsStory NamedTuples round-trip through the cache."""
+        from src.providers.dashboard import Dashboard
+        from src.types import HackerNewsStory
+
+        dm = Dashboard()
+        dm.cache_file = tmp_path / "dashboard_cache.json"
+
+        data = {
+            "weather": {"temp": 20},
+            "hackernews": {
+                "stories": (HackerNewsStory(id=1, title="Test", score=42),),
+                "page": 1,
+            },
+        }
+        dm.save_cache(data)
+
+        # Stories come back as plain dicts, not flattened arrays
+        cached = dm.load_cache()
+        assert cached["hackernews"]["stories"] == [{"id": 1, "title": "Test", "score": 42}]
+        # The live payload handed to the renderer is untouched
+        assert isinstance(data["hackernews"]["stories"][0], HackerNewsStory)
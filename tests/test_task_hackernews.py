@@ -95,7 +95,7 @@ class TestHackerNewsTask:
 
                         # Verify partial refresh called
                         mock_epd.init_part.assert_called_once()
-                        mock_epd.display_partial_buffer.assert_called_once()
+                        mock_epd.display_partial_region.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_quiet_hours_skip(self, mock_epd, mock_layout, mock_dm):
@@ -175,6 +175,21 @@ Some random text
         # Both [x] and [X] should be recognized as completed (with ✓ marker)
         assert goals == ["✓Completed with uppercase", "Not completed"]
 
+    def test_empty_checkbox_items_skipped(self):
+        """Test that checkbox items with no text are skipped entirely."""
+        content = """
+# Goals
+- [ ]
+- [x]
+- [x] Real item
+"""
+        goals, must, optional = parse_markdown_todo(content)
+
+        # Bare "[ ]"/"[x]" must not leak through as literal item text
+        assert goals == ["✓Real item"]
+        assert must == []
+        assert optional == []
+
     def test_real_world_example(self):
         """Test parsing a real-world example."""
         content = """